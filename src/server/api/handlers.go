@@ -3,6 +3,7 @@ package api
 import (
 	"net/http"
 	"encoding/json"
+	"strings"
 
 	"github.com/gin-gonic/gin"
 	"ds_project/src/server/statemachine"
@@ -24,6 +25,19 @@ func NewAPI(stateMachine *statemachine.ScooterStateMachine, proposer *paxos.Prop
 	}
 }
 
+// committedResponse echoes the scooter's committed state so clients don't
+// need a follow-up GET. Propose applies the command locally before it
+// returns, so this is the state the command left.
+func (api *API) committedResponse(status, scooterID string) gin.H {
+	response := gin.H{"status": status, "id": scooterID}
+	if scooter, exists := api.stateMachine.GetScooter(scooterID); exists {
+		response["is_available"] = scooter.IsAvailable
+		response["total_distance"] = scooter.TotalDistance
+		response["current_reservation_id"] = scooter.ReservationID
+	}
+	return response
+}
+
 func (api *API) GetScooters(context *gin.Context) {
 	if context.Query("linearizable") == "true" {
 		cmd := statemachine.ScooterCommand{
@@ -84,7 +98,49 @@ func (api *API) CreateScooter(context *gin.Context) {
 		context.JSON(http.StatusInternalServerError, gin.H{"error": err.Error()})
 		return
 	}
-	context.JSON(http.StatusOK, gin.H{"status": "Scooter created", "id": scooterID})
+	context.JSON(http.StatusOK, api.committedResponse("Scooter created", scooterID))
+}
+
+func (api *API) CreateScooters(context *gin.Context) {
+	var body struct {
+		IDs []string `json:"ids"`
+	}
+	if err := context.ShouldBindJSON(&body); err != nil || len(body.IDs) == 0 {
+		context.JSON(http.StatusBadRequest, gin.H{"error": "No scooter ids given"})
+		return
+	}
+
+	// All the creates go into one batch, so they share a single log entry
+	commands := make([]statemachine.ScooterCommand, 0, len(body.IDs))
+	seen := make(map[string]bool, len(body.IDs))
+	for _, scooterID := range body.IDs {
+		if seen[scooterID] {
+			context.JSON(http.StatusBadRequest, gin.H{"error": "Duplicate scooter id", "id": scooterID})
+			return
+		}
+		seen[scooterID] = true
+		if _, exists := api.stateMachine.GetScooter(scooterID); exists {
+			context.JSON(http.StatusConflict, gin.H{"error": "Scooter already exists", "id": scooterID})
+			return
+		}
+		commands = append(commands, statemachine.ScooterCommand{
+			CommandType: statemachine.Create,
+			ScooterID: scooterID,
+		})
+	}
+
+	cmd := statemachine.ScooterCommand{
+		CommandType: statemachine.Batch,
+		Commands: commands,
+	}
+	cmdBytes, _ :=json.Marshal(cmd)
+	index := api.log.GetNextIndex()
+	_, err := api.proposer.Propose(int64(index), int64(index), cmdBytes)
+	if err != nil {
+		context.JSON(http.StatusInternalServerError, gin.H{"error": err.Error()})
+		return
+	}
+	context.JSON(http.StatusOK, gin.H{"status": "Scooters created", "count": len(body.IDs)})
 }
 
 func (api *API) ReserveScooter(context *gin.Context) {
@@ -118,7 +174,7 @@ func (api *API) ReserveScooter(context *gin.Context) {
 		context.JSON(http.StatusInternalServerError, gin.H{"error": err.Error()})
 		return
 	}
-	context.JSON(http.StatusOK, gin.H{"status": "Scooter reserved", "id": scooterID})
+	context.JSON(http.StatusOK, api.committedResponse("Scooter reserved", scooterID))
 }
 
 func (api *API) ReleaseScooter(context *gin.Context) {
@@ -159,16 +215,128 @@ func (api *API) ReleaseScooter(context *gin.Context) {
 		context.JSON(http.StatusInternalServerError, gin.H{"error": err.Error()})
 		return
 	}
-	context.JSON(http.StatusOK, gin.H{"status": "Scooter released", "id": scooterID})
+
+	context.JSON(http.StatusOK, api.committedResponse("Scooter released", scooterID))
+}
+
+func (api *API) DeleteScooters(context *gin.Context) {
+	var body struct {
+		IDs []string `json:"ids"`
+	}
+	if err := context.ShouldBindJSON(&body); err != nil || len(body.IDs) == 0 {
+		context.JSON(http.StatusBadRequest, gin.H{"error": "No scooter ids given"})
+		return
+	}
+
+	cmd := statemachine.ScooterCommand{
+		CommandType: statemachine.Delete,
+		ScooterIDs: body.IDs,
+	}
+	cmdBytes, _ :=json.Marshal(cmd)
+	index := api.log.GetNextIndex()
+	_, err := api.proposer.Propose(int64(index), int64(index), cmdBytes)
+	if err != nil {
+		context.JSON(http.StatusInternalServerError, gin.H{"error": err.Error()})
+		return
+	}
+	context.JSON(http.StatusOK, gin.H{"status": "Scooters deleted", "count": len(body.IDs)})
 }
 
+func (api *API) BatchOperations(context *gin.Context) {
+	var body []struct {
+		Op            string `json:"op"`
+		ScooterID     string `json:"scooter_id"`
+		ReservationID string `json:"reservation_id"`
+		Distance      int64  `json:"distance"`
+	}
+	if err := context.ShouldBindJSON(&body); err != nil || len(body) == 0 {
+		context.JSON(http.StatusBadRequest, gin.H{"error": "Expected a list of operations"})
+		return
+	}
+
+	commands := make([]statemachine.ScooterCommand, 0, len(body))
+	touched := make([]string, 0, len(body))
+	for _, op := range body {
+		commandType := strings.ToUpper(op.Op)
+		if commandType != statemachine.Create && commandType != statemachine.Reserve && commandType != statemachine.Release {
+			context.JSON(http.StatusBadRequest, gin.H{"error": "Unknown operation: " + op.Op})
+			return
+		}
+		if op.ScooterID == "" {
+			context.JSON(http.StatusBadRequest, gin.H{"error": "Every operation needs a scooter_id"})
+			return
+		}
+		if op.Distance < 0 {
+			context.JSON(http.StatusBadRequest, gin.H{"error": "Distance cannot be negative"})
+			return
+		}
+		commands = append(commands, statemachine.ScooterCommand{
+			CommandType: commandType,
+			ScooterID: op.ScooterID,
+			ReservationID: op.ReservationID,
+			Distance: op.Distance,
+		})
+		touched = append(touched, op.ScooterID)
+	}
+
+	// Check every operation against the state the ones before it leave,
+	// like the single-command handlers do, so nothing in the batch is skipped
+	available := make(map[string]bool)
+	for i, op := range commands {
+		isAvailable, exists := available[op.ScooterID]
+		if !exists {
+			if scooter, found := api.stateMachine.GetScooter(op.ScooterID); found {
+				isAvailable, exists = scooter.IsAvailable, true
+			}
+		}
+		switch {
+		case op.CommandType == statemachine.Create && exists:
+			context.JSON(http.StatusConflict, gin.H{"error": "Scooter already exists", "op": i, "id": op.ScooterID})
+			return
+		case op.CommandType != statemachine.Create && !exists:
+			context.JSON(http.StatusNotFound, gin.H{"error": "Scooter not found", "op": i, "id": op.ScooterID})
+			return
+		case op.CommandType == statemachine.Reserve && !isAvailable:
+			context.JSON(http.StatusConflict, gin.H{"error": "Scooter is not available", "op": i, "id": op.ScooterID})
+			return
+		case op.CommandType == statemachine.Release && isAvailable:
+			context.JSON(http.StatusConflict, gin.H{"error": "Scooter is not reserved", "op": i, "id": op.ScooterID})
+			return
+		}
+		available[op.ScooterID] = op.CommandType != statemachine.Reserve
+	}
+
+	cmd := statemachine.ScooterCommand{
+		CommandType: statemachine.Batch,
+		Commands: commands,
+	}
+	cmdBytes, _ :=json.Marshal(cmd)
+	index := api.log.GetNextIndex()
+	_, err := api.proposer.Propose(int64(index), int64(index), cmdBytes)
+	if err != nil {
+		context.JSON(http.StatusInternalServerError, gin.H{"error": err.Error()})
+		return
+	}
+
+	// The batch is applied locally before Propose returns, so this is the committed state
+	scooters := make(map[string]*statemachine.Scooter)
+	for _, scooterID := range touched {
+		if scooter, exists := api.stateMachine.GetScooter(scooterID); exists {
+			scooters[scooterID] = scooter
+		}
+	}
+	context.JSON(http.StatusOK, gin.H{"status": "Batch committed", "scooters": scooters})
+}
 
 func (api *API) RegisterRoutes(router *gin.Engine) {
 	router.GET("/scooters", api.GetScooters)
+	router.POST("/scooters", api.CreateScooters)
+	router.DELETE("/scooters", api.DeleteScooters)
 	router.GET("/scooters/:id", api.GetScooter)
 	router.PUT("/scooters/:id", api.CreateScooter)
 	router.POST("/scooters/:id/reservations", api.ReserveScooter)
 	router.POST("/scooters/:id/releases", api.ReleaseScooter)
+	router.POST("/batch", api.BatchOperations)
 }
 
 func (api *API) TakeSnapshot(context *gin.Context) {
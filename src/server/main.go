@@ -97,6 +97,7 @@ func main() {
     //   log.Fatal(http.ListenAndServe(":"+*testingPort, nil))
 
 	router := gin.Default()
+	router.UseH2C = true
 	apiHandler.RegisterRoutes(router)
 	router.POST("/snapshot", apiHandler.TakeSnapshot)
 	recovery.Recover(serverAddresses, statementMachine, replicatedLog)
@@ -17,6 +17,8 @@ const (
 	Create = "CREATE"
 	Reserve = "RESERVE"
 	Release = "RELEASE"
+	Delete = "DELETE"
+	Batch  = "BATCH"
 	Noop   = "NOOP"
 )
 
@@ -25,6 +27,8 @@ type ScooterCommand struct {
 	ScooterID     string `json:"scooter_id"`
 	ReservationID string `json:"reservation_id,omitempty"`
 	Distance      int64  `json:"distance,omitempty"`
+	ScooterIDs    []string `json:"scooter_ids,omitempty"`
+	Commands      []ScooterCommand `json:"commands,omitempty"`
 }
 
 type ScooterStateMachine struct {
@@ -52,6 +56,10 @@ func (sm *ScooterStateMachine) Apply(commandBytes []byte) error {
 	sm.mutex.Lock()
 	defer sm.mutex.Unlock()
 
+	return sm.apply(cmd)
+}
+
+func (sm *ScooterStateMachine) apply(cmd ScooterCommand) error {
 	switch cmd.CommandType {
 	case Create:
 
@@ -97,6 +105,33 @@ func (sm *ScooterStateMachine) Apply(commandBytes []byte) error {
 		scooter.TotalDistance += float64(cmd.Distance)
 		scooter.ReservationID = ""
 
+	case Delete:
+
+		for _, scooterID := range cmd.ScooterIDs {
+			delete(sm.scooters, scooterID)
+		}
+
+	case Batch:
+
+		// Sub-commands are applied in order to copies of the scooters they
+		// touch, and the copies replace the originals only if every one
+		// succeeds, so a batch is applied all-or-nothing
+		staged := &ScooterStateMachine{scooters: make(map[string]*Scooter)}
+		for _, subCmd := range cmd.Commands {
+			if scooter, exists := sm.scooters[subCmd.ScooterID]; exists {
+				copied := *scooter
+				staged.scooters[subCmd.ScooterID] = &copied
+			}
+		}
+		for _, subCmd := range cmd.Commands {
+			if err := staged.apply(subCmd); err != nil {
+				return err
+			}
+		}
+		for scooterID, scooter := range staged.scooters {
+			sm.scooters[scooterID] = scooter
+		}
+
 	case Noop:
 
 	}
@@ -12,11 +12,8 @@ Run with: pytest tests/assignment/test_fault_tolerance.py -v
 
 import pytest
 import time
-import sys
-import os
 import requests
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from conftest import (
     create_scooter, get_scooter, get_all_scooters,
     reserve_scooter, release_scooter,
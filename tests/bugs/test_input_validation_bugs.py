@@ -14,10 +14,7 @@ Run with: pytest tests/bugs/test_input_validation_bugs.py -v
 
 import pytest
 import requests
-import sys
-import os
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from conftest import (
     create_scooter, get_scooter,
     reserve_scooter, release_scooter
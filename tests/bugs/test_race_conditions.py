@@ -14,12 +14,9 @@ Run with: pytest tests/bugs/test_race_conditions.py -v
 import pytest
 import requests
 import time
-import sys
-import os
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import threading
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from conftest import (
     create_scooter, get_scooter, get_all_scooters,
     reserve_scooter, release_scooter
@@ -14,11 +14,8 @@ Run with: pytest tests/bugs/test_recovery_bugs.py -v
 import pytest
 import requests
 import time
-import sys
-import os
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from conftest import (
     create_scooter, get_scooter, get_all_scooters,
     reserve_scooter, release_scooter, take_snapshot,
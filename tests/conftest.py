@@ -7,94 +7,436 @@ Nothing fancy here - just straightforward helper code.
 
 import pytest
 import requests
+from requests.adapters import HTTPAdapter
 import time
 import subprocess
 import os
+import asyncio
+import random
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Set USE_HTTP2=1 to send multi-server reads over HTTP/2 (needs httpx[http2])
+USE_HTTP2 = os.environ.get("USE_HTTP2") == "1" and httpx is not None
+
+
+# One keep-alive session shared by all helpers, so repeated calls to the
+# same server reuse a pooled connection instead of opening a new one
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(pool_connections=16, pool_maxsize=64, max_retries=0)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+
+# Set FAKE_SERVER=1 to run tests/unit against the in-process fake in
+# fake_server.py instead of a live cluster (api_url points at the fake)
+USE_FAKE_SERVER = os.environ.get("FAKE_SERVER") == "1"
+if USE_FAKE_SERVER:
+    from fake_server import FAKE_URL, FakeScooterAdapter
+    _SESSION.mount(FAKE_URL, FakeScooterAdapter())
+
+# Worker threads for get_scooter_all, started once and reused by every
+# fan-out instead of spinning up a new pool per call
+_FANOUT_EXECUTOR = ThreadPoolExecutor(max_workers=16)
+
+# Longest the helpers wait to open a connection. Paxos writes can take a
+# while to answer, but an unreachable replica should fail fast instead of
+# holding a test for the whole read timeout.
+_CONNECT_TIMEOUT = 1.0
+
+
+def _timeout(read):
+    """(connect, read) timeout for a helper request."""
+    return (min(_CONNECT_TIMEOUT, read), read)
 
 
 # ============================================================================
 # FIXTURES - Simple configuration fixtures
 # ============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def api_url():
     """Base URL for the API (server 1 directly, since Traefik is disabled)."""
+    return _default_api_url()
+
+
+def _default_api_url():
+    """API_URL from the environment, or the fake server with FAKE_SERVER=1."""
+    if USE_FAKE_SERVER:
+        return FAKE_URL
     return os.environ.get("API_URL", "http://localhost:8081")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def server_urls():
-    """Direct URLs to each of the 5 scooter-server replicas."""
+    """Direct URLs to each of the 5 scooter-server replicas (shared, don't mutate)."""
     base_port = int(os.environ.get("SERVER_BASE_PORT", "8081"))
     return [f"http://localhost:{base_port + i}" for i in range(5)]
 
 
+@pytest.fixture(scope="session")
+def http_session():
+    """
+    The keep-alive session the helpers use, for tests that make their own
+    requests or pass session= explicitly. Closed when the run ends.
+    """
+    yield _SESSION
+    _SESSION.close()
+
+
+@pytest.fixture(scope="session")
+def reachable_servers(server_urls):
+    """
+    The servers that answered a quick probe at the start of the run.
+
+    One HEAD per server with a short timeout, done once and cached for
+    the session. Any HTTP response counts, only connection errors and
+    timeouts don't.
+    """
+    def probe(url):
+        try:
+            _SESSION.head(f"{url}/scooters", timeout=0.5)
+            return True
+        except requests.exceptions.RequestException:
+            return False
+
+    return [url for url, up in zip(server_urls, _FANOUT_EXECUTOR.map(probe, server_urls)) if up]
+
+
+@pytest.fixture(scope="session")
+def executor():
+    """
+    Thread pool for tests that send requests concurrently.
+
+    Shared by the whole run so tests don't each start and join their own
+    threads. Separate from the pool get_scooter_all uses, so a test's
+    tasks can themselves fan out without waiting on each other.
+    """
+    pool = ThreadPoolExecutor(max_workers=16)
+    yield pool
+    pool.shutdown(wait=True)
+
+
 @pytest.fixture
 def etcd_url():
     """URL for the etcd server."""
     return os.environ.get("ETCD_URL", "http://localhost:2379")
 
 
+# pytest-xdist worker running this process ("gw0" when not using -n)
+WORKER_ID = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+
+# Source of the random part of test IDs. Seeded once per process from the
+# OS, so IDs stay unique across runs and workers without a urandom call
+# for every ID like uuid4() makes.
+_ID_RANDOM = random.Random()
+
+
+def _random_suffix():
+    """12 random hex characters for a test ID."""
+    return _ID_RANDOM.randbytes(6).hex()
+
+
 @pytest.fixture
 def unique_scooter_id():
-    """Generate a unique scooter ID for each test to avoid conflicts."""
-    import uuid
-    return f"scooter-{uuid.uuid4().hex[:8]}"
+    """
+    Generate a unique scooter ID for each test to avoid conflicts.
+
+    The xdist worker id is part of the ID so parallel workers
+    (pytest -n 4) never collide.
+    """
+    return f"scooter-{WORKER_ID}-{_random_suffix()}"
+
+
+@pytest.fixture
+def prepared_scooter(api_url, unique_scooter_id):
+    """
+    A freshly created scooter, ready to use.
+
+    The create goes through the batch endpoint, so tests that need more
+    setup can extend the same single log entry instead of doing one
+    Paxos round per step.
+    """
+    response = batch_operations(api_url, [("create", unique_scooter_id)])
+    assert response.status_code == 200, f"Setup create failed: {response.status_code}"
+    return unique_scooter_id
 
 
 @pytest.fixture
 def unique_reservation_id():
-    """Generate a unique reservation ID for each test."""
-    import uuid
-    return f"res-{uuid.uuid4().hex[:8]}"
+    """Generate a unique reservation ID for each test (per xdist worker)."""
+    return f"res-{WORKER_ID}-{_random_suffix()}"
 
 
 # ============================================================================
 # HELPER FUNCTIONS - Simple wrappers around API calls
 # ============================================================================
 
-def create_scooter(url, scooter_id):
+def parse_json(response):
+    """
+    Parse a response body as JSON.
+
+    Same result as response.json(), but uses orjson when it's installed,
+    which is a lot faster in tests that parse inside tight loops.
+    """
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def scooter_matches(scooter, expected):
+    """
+    Check a scooter against the field values a test expects.
+
+    A missing or null current_reservation_id counts as "" (not reserved),
+    since servers differ in how they report it.
+
+    Args:
+        scooter: Scooter dict from the API
+        expected: Dict of field -> expected value (only these are checked)
+
+    Returns:
+        True if every expected field matches
+    """
+    actual = dict(scooter)
+    actual["current_reservation_id"] = actual.get("current_reservation_id") or ""
+    return all(actual.get(field) == value for field, value in expected.items())
+
+
+# Every scooter created through create_scooter, deleted at session end
+_created_ids = set()
+
+
+def create_scooter(url, scooter_id, session=None):
     """
     Create a new scooter.
 
     Args:
         url: Base API URL
         scooter_id: ID for the new scooter
+        session: requests.Session to send with (defaults to the shared one)
+
+    Returns:
+        requests.Response object (body includes the new scooter's
+        is_available and total_distance)
+    """
+    _created_ids.add(scooter_id)
+    return (session or _SESSION).put(f"{url}/scooters/{scooter_id}", timeout=_timeout(60))
+
+
+def delete_scooters(url, scooter_ids):
+    """
+    Delete several scooters in one request (a single log entry).
+
+    Args:
+        url: Base API URL
+        scooter_ids: IDs of scooters to delete
 
     Returns:
         requests.Response object
     """
-    return requests.put(f"{url}/scooters/{scooter_id}", timeout=60)
+    return _SESSION.delete(
+        f"{url}/scooters",
+        json={"ids": list(scooter_ids)},
+        timeout=_timeout(60)
+    )
 
 
-def get_scooter(url, scooter_id):
+def create_scooters_bulk(url, scooter_ids):
+    """
+    Create several scooters in one request (a single log entry).
+
+    Args:
+        url: Base API URL
+        scooter_ids: IDs for the new scooters
+
+    Returns:
+        requests.Response object
+    """
+    _created_ids.update(scooter_ids)
+    return _SESSION.post(
+        f"{url}/scooters",
+        json={"ids": list(scooter_ids)},
+        timeout=_timeout(60)
+    )
+
+
+def create_scooters_concurrently(url, scooter_ids):
+    """
+    Create several scooters at the same time.
+
+    The PUTs are sent together on one asyncio event loop with httpx, or
+    from a thread each if httpx isn't installed.
+
+    Args:
+        url: Base API URL
+        scooter_ids: IDs for the new scooters
+
+    Returns:
+        List with a response (or the exception raised) per scooter, in order
+    """
+    _created_ids.update(scooter_ids)
+    if httpx is not None:
+        return asyncio.run(_create_scooters_async(url, scooter_ids))
+
+    def create_one(scooter_id):
+        try:
+            return _SESSION.put(f"{url}/scooters/{scooter_id}", timeout=_timeout(60))
+        except requests.exceptions.RequestException as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=len(scooter_ids)) as executor:
+        return list(executor.map(create_one, scooter_ids))
+
+
+async def _create_scooters_async(url, scooter_ids):
+    """httpx version of create_scooters_concurrently."""
+    async with httpx.AsyncClient(timeout=httpx.Timeout(60, connect=_CONNECT_TIMEOUT)) as client:
+        return await asyncio.gather(
+            *(client.put(f"{url}/scooters/{scooter_id}") for scooter_id in scooter_ids),
+            return_exceptions=True
+        )
+
+
+def get_scooter(url, scooter_id, timeout=60, session=None):
     """
     Get a scooter by ID.
 
     Args:
         url: Base API URL
         scooter_id: ID of scooter to fetch
+        timeout: Seconds to wait for the server (use a short one when
+            probing replicas that may be down)
+        session: requests.Session to send with (defaults to the shared one)
 
     Returns:
         requests.Response object
     """
-    return requests.get(f"{url}/scooters/{scooter_id}", timeout=60)
+    return (session or _SESSION).get(f"{url}/scooters/{scooter_id}", timeout=_timeout(timeout))
 
 
-def get_all_scooters(url):
+def get_scooter_all(urls, scooter_id, timeout=60):
+    """
+    Get a scooter from several servers at once.
+
+    With USE_HTTP2=1 the requests are multiplexed over HTTP/2 with httpx,
+    otherwise (or if HTTP/2 can't be used) they are sent in parallel
+    with plain requests.
+
+    Args:
+        urls: List of server URLs
+        scooter_id: ID of scooter to fetch
+        timeout: Seconds to wait for each server
+
+    Returns:
+        Dict of url -> response, or None for servers that couldn't be reached
+    """
+    return _fan_out(lambda: dict(zip(urls, _FANOUT_EXECUTOR.map(
+        lambda url: _fetch_scooter(url, scooter_id, timeout), urls
+    ))))
+
+
+# HTTP/2 client for USE_HTTP2=1, opened on first use and kept for the
+# session so every fan-out multiplexes onto the same connection per server
+_H2_CLIENT = None
+
+
+def _h2_client():
+    """The shared HTTP/2 client (servers are plain http, so h2c)."""
+    global _H2_CLIENT
+    if _H2_CLIENT is None:
+        _H2_CLIENT = httpx.Client(
+            http1=False, http2=True,
+            limits=httpx.Limits(max_keepalive_connections=20)
+        )
+    return _H2_CLIENT
+
+
+def _fetch_scooter(url, scooter_id, timeout):
+    """
+    GET one scooter for a fan-out, over HTTP/2 if it's enabled.
+
+    Returns:
+        The response, or None if the server couldn't be reached in time
+    """
+    if USE_HTTP2:
+        try:
+            return _h2_client().get(
+                f"{url}/scooters/{scooter_id}",
+                timeout=httpx.Timeout(timeout, connect=min(_CONNECT_TIMEOUT, timeout))
+            )
+        except (httpx.ConnectError, httpx.TimeoutException):
+            return None
+    try:
+        return get_scooter(url, scooter_id, timeout=timeout)
+    except requests.exceptions.RequestException:
+        return None
+
+
+def _fan_out(run):
+    """
+    Run a multi-server read, dropping to HTTP/1.1 if HTTP/2 fails.
+
+    If h2 isn't installed or a server doesn't speak HTTP/2, the rest of
+    the run stays on keep-alive HTTP/1.1 instead of paying for a failed
+    negotiation on every poll.
+    """
+    global USE_HTTP2
+    if USE_HTTP2:
+        try:
+            return run()
+        except (ImportError, httpx.HTTPError):
+            USE_HTTP2 = False
+    return run()
+
+
+def get_all_scooters(url, session=None):
     """
     Get all scooters.
 
     Args:
         url: Base API URL
+        session: requests.Session to send with (defaults to the shared one)
 
     Returns:
         requests.Response object
     """
-    return requests.get(f"{url}/scooters", timeout=60)
+    return (session or _SESSION).get(f"{url}/scooters", timeout=_timeout(60))
 
 
-def reserve_scooter(url, scooter_id, reservation_id):
+def get_scooters_batch(url, scooter_ids, timeout=60):
+    """
+    Get several scooters from one server in a single request.
+
+    Fetches the full list once and picks out the wanted IDs, instead of
+    one GET per scooter.
+
+    Args:
+        url: Base API URL
+        scooter_ids: IDs of scooters to fetch
+        timeout: Seconds to wait for the server
+
+    Returns:
+        Dict of scooter_id -> scooter for the IDs the server has
+        (empty if the server answered with an error)
+    """
+    response = _SESSION.get(f"{url}/scooters", timeout=_timeout(timeout))
+    if response.status_code != 200:
+        return {}
+    wanted = set(scooter_ids)
+    return {s["id"]: s for s in parse_json(response) if s["id"] in wanted}
+
+
+def reserve_scooter(url, scooter_id, reservation_id, session=None):
     """
     Reserve a scooter.
 
@@ -102,18 +444,20 @@ def reserve_scooter(url, scooter_id, reservation_id):
         url: Base API URL
         scooter_id: ID of scooter to reserve
         reservation_id: Reservation identifier
+        session: requests.Session to send with (defaults to the shared one)
 
     Returns:
-        requests.Response object
+        requests.Response object (body includes the scooter's
+        is_available and current_reservation_id after the reserve)
     """
-    return requests.post(
+    return (session or _SESSION).post(
         f"{url}/scooters/{scooter_id}/reservations",
         json={"reservation_id": reservation_id},
-        timeout=60
+        timeout=_timeout(60)
     )
 
 
-def release_scooter(url, scooter_id, distance):
+def release_scooter(url, scooter_id, distance, session=None):
     """
     Release a scooter and record distance traveled.
 
@@ -121,17 +465,49 @@ def release_scooter(url, scooter_id, distance):
         url: Base API URL
         scooter_id: ID of scooter to release
         distance: Distance traveled during rental
+        session: requests.Session to send with (defaults to the shared one)
 
     Returns:
-        requests.Response object
+        requests.Response object (body includes the scooter's
+        is_available and total_distance after the release)
     """
-    return requests.post(
+    return (session or _SESSION).post(
         f"{url}/scooters/{scooter_id}/releases",
         json={"distance": distance},
-        timeout=60
+        timeout=_timeout(60)
     )
 
 
+def batch_operations(url, ops):
+    """
+    Run several operations as a single log entry.
+
+    Args:
+        url: Base API URL
+        ops: List of tuples, one per operation, applied in order:
+            ("create", scooter_id)
+            ("reserve", scooter_id, reservation_id)
+            ("release", scooter_id, distance)
+
+    Returns:
+        requests.Response object (body has the committed state of
+        every scooter the batch touched). If any operation would not
+        apply, the whole batch is rejected with the error of the first
+        one and its index in "op".
+    """
+    body = []
+    for op, scooter_id, *args in ops:
+        entry = {"op": op, "scooter_id": scooter_id}
+        if op == "create":
+            _created_ids.add(scooter_id)
+        elif op == "reserve":
+            entry["reservation_id"] = args[0]
+        elif op == "release":
+            entry["distance"] = args[0]
+        body.append(entry)
+    return _SESSION.post(f"{url}/batch", json=body, timeout=_timeout(60))
+
+
 def take_snapshot(url):
     """
     Trigger a state snapshot.
@@ -142,7 +518,7 @@ def take_snapshot(url):
     Returns:
         requests.Response object
     """
-    return requests.post(f"{url}/snapshot", timeout=60)
+    return _SESSION.post(f"{url}/snapshot", timeout=_timeout(60))
 
 
 def get_servers(url):
@@ -155,7 +531,7 @@ def get_servers(url):
     Returns:
         requests.Response object
     """
-    return requests.get(f"{url}/servers", timeout=60)
+    return _SESSION.get(f"{url}/servers", timeout=_timeout(60))
 
 
 # ============================================================================
@@ -176,7 +552,7 @@ def wait_for_server(url, timeout=30):
     start = time.time()
     while time.time() - start < timeout:
         try:
-            response = requests.get(f"{url}/scooters", timeout=2)
+            response = _SESSION.get(f"{url}/scooters", timeout=2)
             if response.status_code == 200:
                 return True
         except requests.exceptions.RequestException:
@@ -185,6 +561,36 @@ def wait_for_server(url, timeout=30):
     return False
 
 
+def wait_until(condition, timeout=5.0, interval=0.01, backoff=2.0, max_interval=1.0):
+    """
+    Wait for a condition to become true, backing off between checks.
+
+    Use this instead of a fixed time.sleep() before asserting on
+    replicated state - it returns as soon as the cluster has converged.
+    The first checks come quickly (healthy clusters converge in
+    milliseconds), later ones further apart.
+
+    Args:
+        condition: Function with no arguments, returns truthy when done
+        timeout: Max seconds to wait
+        interval: Seconds before the second check
+        backoff: Factor the interval grows by after each failed check
+        max_interval: Upper bound on the interval
+
+    Returns:
+        True if the condition became true, False if timeout
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        if condition():
+            return True
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(interval, remaining))
+        interval = min(interval * backoff, max_interval)
+
+
 def wait_for_replication(server_urls, scooter_id, timeout=10):
     """
     Wait for a scooter to be visible on all servers.
@@ -197,22 +603,78 @@ def wait_for_replication(server_urls, scooter_id, timeout=10):
     Returns:
         True if replicated to all, False if timeout
     """
-    start = time.time()
-    while time.time() - start < timeout:
-        all_have_it = True
+    def all_have_it():
         for url in server_urls:
             try:
-                response = get_scooter(url, scooter_id)
-                if response.status_code != 200:
-                    all_have_it = False
-                    break
+                if get_scooter(url, scooter_id).status_code != 200:
+                    return False
             except requests.exceptions.RequestException:
-                all_have_it = False
-                break
-        if all_have_it:
-            return True
-        time.sleep(0.5)
-    return False
+                return False
+        return True
+
+    return wait_until(all_have_it, timeout=timeout)
+
+
+def count_matching(server_urls, scooter_id, predicate=lambda scooter: True, timeout=0.25):
+    """
+    Count the servers whose copy of a scooter satisfies a predicate.
+
+    Meant to be polled with wait_until, e.g. until a quorum has applied
+    a write. The servers are queried in parallel with a short timeout so
+    one slow replica doesn't hold up each poll.
+
+    Args:
+        server_urls: List of server URLs
+        scooter_id: Scooter ID to check
+        predicate: Function taking the scooter dict, returns truthy on a match
+            (by default, any server that has the scooter matches)
+        timeout: Seconds to wait for each server
+
+    Returns:
+        Number of servers that have the scooter and match
+    """
+    responses = get_scooter_all(server_urls, scooter_id, timeout=timeout)
+    return sum(
+        1 for response in responses.values()
+        if response is not None and response.status_code == 200
+        and predicate(parse_json(response))
+    )
+
+
+def quorum_reached(server_urls, scooter_id, predicate=lambda scooter: True, k=3, timeout=0.25):
+    """
+    Check whether at least k servers' copies of a scooter satisfy a predicate.
+
+    Like count_matching(...) >= k, but returns as soon as the k-th match
+    comes in rather than waiting on slow or unreachable replicas.
+
+    Args:
+        server_urls: List of server URLs
+        scooter_id: Scooter ID to check
+        predicate: Function taking the scooter dict, returns truthy on a match
+        k: Matches needed (3 is a majority of 5)
+        timeout: Seconds to wait for each server
+
+    Returns:
+        True if k servers match, False otherwise
+    """
+    def matches(url):
+        response = _fetch_scooter(url, scooter_id, timeout)
+        return response is not None and response.status_code == 200 and predicate(parse_json(response))
+
+    def run():
+        futures = [_FANOUT_EXECUTOR.submit(matches, url) for url in server_urls]
+        count = 0
+        for future in as_completed(futures):
+            if future.result():
+                count += 1
+                if count >= k:
+                    for f in futures:
+                        f.cancel()
+                    return True
+        return False
+
+    return _fan_out(run)
 
 
 def wait_for_leader(server_urls, timeout=30):
@@ -232,7 +694,7 @@ def wait_for_leader(server_urls, timeout=30):
             try:
                 response = get_servers(url)
                 if response.status_code == 200:
-                    servers = response.json()
+                    servers = parse_json(response)
                     for server in servers:
                         if server.get("is_leader"):
                             return url
@@ -317,16 +779,64 @@ def docker_compose():
 
 
 # ============================================================================
-# CLEANUP FIXTURE - Clean up test scooters after tests
+# SLOW TESTS - Skipped unless --slow is given
 # ============================================================================
 
+def pytest_addoption(parser):
+    """Add the --slow flag."""
+    parser.addoption(
+        "--slow", action="store_true", default=False,
+        help="also run tests marked slow (long request loops)"
+    )
+
+
+def pytest_configure(config):
+    """Register the slow marker."""
+    config.addinivalue_line(
+        "markers", "slow: many sequential requests for little extra coverage; needs --slow"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip tests marked slow unless --slow was passed."""
+    if config.getoption("--slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="slow test, run with --slow")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+# ============================================================================
+# CLEANUP - Clean up test scooters after tests
+# ============================================================================
+
+def pytest_sessionfinish(session, exitstatus):
+    """
+    Delete every scooter the tests created, in one bulk request.
+
+    Without this the cluster's state keeps growing across runs, which
+    slows down get_all_scooters and snapshots for every later test.
+    Also closes the shared HTTP/2 client if USE_HTTP2 opened one.
+    """
+    if _H2_CLIENT is not None:
+        _H2_CLIENT.close()
+    if not _created_ids:
+        return
+    try:
+        delete_scooters(_default_api_url(), _created_ids)
+    except requests.exceptions.RequestException:
+        # Cluster is already down (e.g. after e2e tests) - nothing to clean
+        pass
+
+
 @pytest.fixture
 def cleanup_scooters(api_url):
     """
-    Fixture that tracks created scooters and could clean them up.
+    Fixture that tracks created scooters for debugging.
 
-    Note: Since we use unique IDs per test and the system doesn't have
-    a delete endpoint, we just track what was created for debugging.
+    Note: Scooters made with create_scooter are deleted in bulk at the
+    end of the session (see pytest_sessionfinish), this just logs them.
     """
     created = []
 
@@ -336,7 +846,5 @@ def cleanup_scooters(api_url):
 
     yield track
 
-    # In a real system with delete, we'd clean up here
-    # For now, just log what was created
     if created:
         print(f"\nTest created scooters: {created}")
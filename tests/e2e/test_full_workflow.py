@@ -13,11 +13,8 @@ Run with: pytest tests/e2e/test_full_workflow.py -v
 
 import pytest
 import time
-import sys
-import os
 from concurrent.futures import ThreadPoolExecutor
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from conftest import (
     create_scooter, get_scooter, get_all_scooters,
     reserve_scooter, release_scooter,
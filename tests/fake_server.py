@@ -0,0 +1,232 @@
+"""
+In-process fake of the scooter server's REST API.
+
+With FAKE_SERVER=1, conftest mounts FakeScooterAdapter on the helpers'
+requests session for FAKE_URL and points api_url at it, so the unit
+tests run without a cluster:
+    FAKE_SERVER=1 pytest tests/unit
+
+The fake keeps scooters in a dict and answers with the same routes,
+status codes and bodies as src/server/api/handlers.go. It is a single
+node with no Paxos, so only the tests/unit suite should be run against
+it. The paxos, integration and e2e tests need the real cluster.
+"""
+
+import json
+import re
+import threading
+from urllib.parse import urlsplit, unquote
+
+import requests
+from requests.adapters import BaseAdapter
+
+
+# Base URL the fake answers on (never resolved, the adapter intercepts it)
+FAKE_URL = "http://fake-scooter-server"
+
+
+class FakeScooterServer:
+    """
+    The scooter state machine plus the API's request validation.
+
+    Every handler returns (status_code, body).
+    """
+
+    def __init__(self):
+        self.scooters = {}
+        self.lock = threading.Lock()
+
+    def handle(self, method, path, body):
+        """Route one request. Returns (status_code, body)."""
+        with self.lock:
+            if path == "/scooters":
+                if method == "GET":
+                    return 200, [self._view(s) for s in self.scooters.values()]
+                if method == "POST":
+                    return self.create_many(body)
+                if method == "DELETE":
+                    return self.delete_many(body)
+            if path == "/batch" and method == "POST":
+                return self.batch(body)
+            if path == "/snapshot" and method == "POST":
+                return 200, {"status": "Snapshot taken", "index": 0}
+
+            match = re.fullmatch(r"/scooters/([^/]+)(?:/(reservations|releases))?", path)
+            if match:
+                scooter_id, action = unquote(match.group(1)), match.group(2)
+                if action is None and method == "GET":
+                    return self.get(scooter_id)
+                if action is None and method == "PUT":
+                    return self.create(scooter_id)
+                if action == "reservations" and method == "POST":
+                    return self.reserve(scooter_id, body)
+                if action == "releases" and method == "POST":
+                    return self.release(scooter_id, body)
+            return 404, {"error": "Not found"}
+
+    def get(self, scooter_id):
+        if scooter_id not in self.scooters:
+            return 404, {"error": "Scooter not found"}
+        return 200, self._view(self.scooters[scooter_id])
+
+    def create(self, scooter_id):
+        if scooter_id in self.scooters:
+            return 409, {"error": "Scooter already exists"}
+        self._apply_create(scooter_id)
+        return 200, self._committed("Scooter created", scooter_id)
+
+    def create_many(self, body):
+        ids = body.get("ids") if isinstance(body, dict) else None
+        if not ids:
+            return 400, {"error": "No scooter ids given"}
+        seen = set()
+        for scooter_id in ids:
+            if scooter_id in seen:
+                return 400, {"error": "Duplicate scooter id", "id": scooter_id}
+            seen.add(scooter_id)
+            if scooter_id in self.scooters:
+                return 409, {"error": "Scooter already exists", "id": scooter_id}
+        for scooter_id in ids:
+            self._apply_create(scooter_id)
+        return 200, {"status": "Scooters created", "count": len(ids)}
+
+    def delete_many(self, body):
+        ids = body.get("ids") if isinstance(body, dict) else None
+        if not ids:
+            return 400, {"error": "No scooter ids given"}
+        for scooter_id in ids:
+            self.scooters.pop(scooter_id, None)
+        return 200, {"status": "Scooters deleted", "count": len(ids)}
+
+    def reserve(self, scooter_id, body):
+        scooter = self.scooters.get(scooter_id)
+        if scooter is None:
+            return 404, {"error": "Scooter not found"}
+        if not scooter["is_available"]:
+            return 409, {"error": "Scooter is not available"}
+        self._apply_reserve(scooter_id, (body or {}).get("reservation_id", ""))
+        return 200, self._committed("Scooter reserved", scooter_id)
+
+    def release(self, scooter_id, body):
+        distance = (body or {}).get("distance", 0)
+        if not isinstance(distance, int) or isinstance(distance, bool):
+            return 400, {"error": "Invalid distance"}
+        if distance < 0:
+            return 400, {"error": "Distance cannot be negative"}
+        scooter = self.scooters.get(scooter_id)
+        if scooter is None:
+            return 404, {"error": "Scooter not found"}
+        if scooter["is_available"]:
+            return 409, {"error": "Scooter is not reserved"}
+        self._apply_release(scooter_id, distance)
+        return 200, self._committed("Scooter released", scooter_id)
+
+    def batch(self, body):
+        if not isinstance(body, list) or not body:
+            return 400, {"error": "Expected a list of operations"}
+        for op in body:
+            if op.get("op", "").lower() not in ("create", "reserve", "release"):
+                return 400, {"error": "Unknown operation: " + str(op.get("op"))}
+            if not op.get("scooter_id"):
+                return 400, {"error": "Every operation needs a scooter_id"}
+            if op.get("distance", 0) < 0:
+                return 400, {"error": "Distance cannot be negative"}
+
+        # Every operation must apply to the state the ones before it leave,
+        # otherwise the whole batch is rejected before anything changes
+        available = {}
+        for i, op in enumerate(body):
+            kind, scooter_id = op["op"].lower(), op["scooter_id"]
+            if scooter_id not in available and scooter_id in self.scooters:
+                available[scooter_id] = self.scooters[scooter_id]["is_available"]
+            exists = scooter_id in available
+            if kind == "create" and exists:
+                return 409, {"error": "Scooter already exists", "op": i, "id": scooter_id}
+            if kind != "create" and not exists:
+                return 404, {"error": "Scooter not found", "op": i, "id": scooter_id}
+            if kind == "reserve" and not available[scooter_id]:
+                return 409, {"error": "Scooter is not available", "op": i, "id": scooter_id}
+            if kind == "release" and available[scooter_id]:
+                return 409, {"error": "Scooter is not reserved", "op": i, "id": scooter_id}
+            available[scooter_id] = kind != "reserve"
+
+        for op in body:
+            kind, scooter_id = op["op"].lower(), op["scooter_id"]
+            if kind == "create":
+                self._apply_create(scooter_id)
+            elif kind == "reserve":
+                self._apply_reserve(scooter_id, op.get("reservation_id", ""))
+            else:
+                self._apply_release(scooter_id, op.get("distance", 0))
+
+        touched = {op["scooter_id"] for op in body}
+        return 200, {"status": "Batch committed", "scooters": {
+            scooter_id: self._view(self.scooters[scooter_id])
+            for scooter_id in touched if scooter_id in self.scooters
+        }}
+
+    def _apply_create(self, scooter_id):
+        scooter = {"id": scooter_id, "is_available": True, "total_distance": 0,
+                   "current_reservation_id": ""}
+        self.scooters[scooter_id] = scooter
+        return scooter
+
+    def _apply_reserve(self, scooter_id, reservation_id):
+        scooter = self.scooters[scooter_id]
+        scooter["is_available"] = False
+        scooter["current_reservation_id"] = reservation_id
+
+    def _apply_release(self, scooter_id, distance):
+        scooter = self.scooters[scooter_id]
+        scooter["is_available"] = True
+        scooter["total_distance"] += distance
+        scooter["current_reservation_id"] = ""
+
+    def _committed(self, status, scooter_id):
+        """A write's response, echoing the scooter's committed state."""
+        scooter = self.scooters[scooter_id]
+        return {"status": status, "id": scooter_id,
+                "is_available": scooter["is_available"],
+                "total_distance": scooter["total_distance"],
+                "current_reservation_id": scooter["current_reservation_id"]}
+
+    @staticmethod
+    def _view(scooter):
+        """The scooter as the API serializes it (empty reservation omitted)."""
+        view = dict(scooter)
+        if not view["current_reservation_id"]:
+            del view["current_reservation_id"]
+        return view
+
+
+class FakeScooterAdapter(BaseAdapter):
+    """
+    requests transport adapter that answers from a FakeScooterServer
+    instead of opening a connection.
+    """
+
+    def __init__(self, server=None):
+        super().__init__()
+        self.server = server or FakeScooterServer()
+
+    def send(self, request, **kwargs):
+        body = None
+        if request.body:
+            try:
+                body = json.loads(request.body)
+            except ValueError:
+                body = None
+
+        status, payload = self.server.handle(request.method, urlsplit(request.url).path, body)
+
+        response = requests.Response()
+        response.status_code = status
+        response.headers["Content-Type"] = "application/json; charset=utf-8"
+        response._content = json.dumps(payload).encode()
+        response.encoding = "utf-8"
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
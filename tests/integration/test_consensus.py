@@ -13,12 +13,9 @@ Run with: pytest tests/integration/test_consensus.py -v
 
 import pytest
 import time
-import sys
-import os
 import requests
 from concurrent.futures import ThreadPoolExecutor
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from conftest import (
     create_scooter, get_scooter,
     reserve_scooter, release_scooter,
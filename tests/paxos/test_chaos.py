@@ -14,14 +14,11 @@ Note: Some of these tests may take longer to run.
 
 import pytest
 import time
-import sys
-import os
 import random
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import threading
 import requests
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from conftest import (
     create_scooter, get_scooter, get_all_scooters,
     reserve_scooter, release_scooter, take_snapshot,
@@ -12,23 +12,80 @@ We can't inspect the log directly, but we can observe its effects
 through the state machine.
 
 Run with: pytest tests/paxos/test_multipaxos_log.py -v
+Shared fixtures are per worker, so the tests can also run in parallel:
+    pytest tests/paxos/test_multipaxos_log.py -n 4
 """
 
 import pytest
-import time
-import sys
-import os
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import threading
+import requests
+import asyncio
+import uuid
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from conftest import (
-    create_scooter, get_scooter, get_all_scooters,
-    reserve_scooter, release_scooter,
-    wait_for_replication
+    create_scooter, create_scooters_concurrently, get_scooter, get_scooter_all,
+    get_scooters_batch, reserve_scooter, release_scooter, batch_operations, parse_json,
+    wait_for_replication, wait_until, scooter_matches, WORKER_ID
 )
 
 
+def _read_scooter(url, scooter_id):
+    """Scooter state on one server, or None if it isn't there (yet)."""
+    try:
+        response = get_scooter(url, scooter_id, timeout=1.0)
+    except requests.exceptions.RequestException:
+        return None
+    if response.status_code != 200:
+        return None
+    return parse_json(response)
+
+
+def _read_scooters(server_urls, scooter_id):
+    """Scooter state from every server that has it, fetched in parallel."""
+    responses = get_scooter_all(server_urls, scooter_id, timeout=1.0)
+    return {
+        url: parse_json(response) for url, response in responses.items()
+        if response is not None and response.status_code == 200
+    }
+
+
+def _read_scooters_batch(server_urls, scooter_ids):
+    """Several scooters from each reachable server, one request per server."""
+    found = {}
+    for url in server_urls:
+        try:
+            found[url] = get_scooters_batch(url, scooter_ids, timeout=1.0)
+        except requests.exceptions.RequestException:
+            pass
+    return found
+
+
+def _replicas_agree(server_urls, scooter_id, expected_distance):
+    """True once a majority responds and every responding server has the distance."""
+    distances = [s["total_distance"] for s in _read_scooters(server_urls, scooter_id).values()]
+    return len(distances) >= 3 and all(d == expected_distance for d in distances)
+
+
+@pytest.fixture(scope="module")
+def shared_scooter(server_urls):
+    """
+    One scooter reused by the replication tests.
+
+    Each test leaves it released, so the next one can reserve it again.
+    Tests assert on the distance added relative to the baseline they read
+    at the start.
+    """
+    scooter_id = f"shared-{WORKER_ID}-{uuid.uuid4().hex[:8]}"
+    response = create_scooter(server_urls[0], scooter_id)
+    assert response.status_code == 200, f"Setup create failed: {response.status_code}"
+    wait_until(lambda: _replicas_agree(server_urls, scooter_id, 0))
+    return scooter_id
+
+
 class TestLogOrdering:
     """
     Tests for log ordering.
@@ -44,34 +101,24 @@ class TestLogOrdering:
         should end up with the same final state.
         """
         # Do operations on server 0
-        create_scooter(server_urls[0], unique_scooter_id)
-        time.sleep(0.5)
+        response = create_scooter(server_urls[0], unique_scooter_id)
+        assert response.status_code == 200
 
         for i in range(5):
-            reserve_scooter(server_urls[0], unique_scooter_id, f"order-test-{i}")
-            release_scooter(server_urls[0], unique_scooter_id, (i + 1) * 10)
+            response = reserve_scooter(server_urls[0], unique_scooter_id, f"order-test-{i}")
+            assert response.status_code == 200
+            response = release_scooter(server_urls[0], unique_scooter_id, (i + 1) * 10)
+            assert response.status_code == 200
 
         # Expected: 10 + 20 + 30 + 40 + 50 = 150
         expected_distance = 150
 
-        # Wait for replication
-        time.sleep(3)
-
-        # All servers should have the same state
-        distances = []
-        for url in server_urls:
-            try:
-                response = get_scooter(url, unique_scooter_id)
-                if response.status_code == 200:
-                    distances.append(response.json()["total_distance"])
-            except Exception:
-                pass
-
-        # All responding servers should agree
-        assert len(distances) >= 3, "Not enough servers responded"
-        for d in distances:
-            assert d == expected_distance, \
-                f"Server has wrong distance {d}, expected {expected_distance}"
+        # Commits reach the other servers asynchronously, so poll until a
+        # majority responds and every responding server has the same state
+        assert wait_until(
+            lambda: _replicas_agree(server_urls, unique_scooter_id, expected_distance),
+            timeout=5
+        ), f"Servers did not all converge on distance {expected_distance}"
 
     def test_sequential_commands_sequential_slots(self, api_url, unique_scooter_id):
         """
@@ -90,7 +137,7 @@ class TestLogOrdering:
 
         # Total should be sum (1+2+...+10 = 55)
         response = get_scooter(api_url, unique_scooter_id)
-        assert response.json()["total_distance"] == 55
+        assert parse_json(response)["total_distance"] == 55
 
     def test_concurrent_commands_ordered(self, api_url, unique_scooter_id):
         """
@@ -101,26 +148,21 @@ class TestLogOrdering:
         """
         # Create multiple scooters concurrently
         scooter_ids = [f"{unique_scooter_id}-concurrent-{i}" for i in range(5)]
+        results = create_scooters_concurrently(api_url, scooter_ids)
 
-        def create_one(sid):
-            try:
-                return create_scooter(api_url, sid)
-            except Exception as e:
-                return e
-
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            futures = [executor.submit(create_one, sid) for sid in scooter_ids]
-            results = [f.result() for f in as_completed(futures)]
+        # Each result is a response, or the exception the request raised
+        for sid, result in zip(scooter_ids, results):
+            assert getattr(result, "status_code", None) == 200, \
+                f"Create of {sid} failed: {result!r}"
 
         # Wait for consistency
-        time.sleep(2)
+        wait_until(lambda: len(get_scooters_batch(api_url, scooter_ids)) == len(scooter_ids))
 
         # All should exist
-        response = get_all_scooters(api_url)
-        all_ids = [s["id"] for s in response.json()]
+        found = get_scooters_batch(api_url, scooter_ids)
 
         for sid in scooter_ids:
-            assert sid in all_ids, f"Scooter {sid} not created"
+            assert sid in found, f"Scooter {sid} not created"
 
 
 class TestLogGaps:
@@ -141,19 +183,19 @@ class TestLogGaps:
         create_scooter(api_url, unique_scooter_id)
 
         # Sequential operations
-        total = 0
-        for i in range(10):
-            reserve_scooter(api_url, unique_scooter_id, f"gap-{i}")
+        reservations = [f"gap-{i}" for i in range(10)]
+        expected = [(i + 1) * 5 for i in range(10)]
+        for res_id, min_distance in zip(reservations, expected):
+            reserve_scooter(api_url, unique_scooter_id, res_id)
             release_scooter(api_url, unique_scooter_id, 5)
-            total += 5
 
             # Check state after each operation
             response = get_scooter(api_url, unique_scooter_id)
-            current_distance = response.json()["total_distance"]
+            current_distance = parse_json(response)["total_distance"]
 
             # Distance should only increase, never decrease
-            assert current_distance >= (i + 1) * 5, \
-                f"Distance went backwards: got {current_distance}, expected at least {(i+1)*5}"
+            assert current_distance >= min_distance, \
+                f"Distance went backwards: got {current_distance}, expected at least {min_distance}"
 
     def test_no_gaps_in_applied_state(self, api_url, unique_scooter_id):
         """
@@ -163,16 +205,21 @@ class TestLogGaps:
         """
         create_scooter(api_url, unique_scooter_id)
 
-        # Do 20 operations
-        for i in range(20):
-            reserve_scooter(api_url, unique_scooter_id, f"no-gap-{i}")
-            release_scooter(api_url, unique_scooter_id, 1)
+        # Do 20 operations, submitted as one batch
+        reservations = [f"no-gap-{i}" for i in range(20)]
+        ops = []
+        for res_id in reservations:
+            ops.append(("reserve", unique_scooter_id, res_id))
+            ops.append(("release", unique_scooter_id, 1))
+        response = batch_operations(api_url, ops)
+        assert response.status_code == 200
 
         # Final state should reflect all 20 releases
         response = get_scooter(api_url, unique_scooter_id)
-        assert response.json()["total_distance"] == 20, \
+        assert parse_json(response)["total_distance"] == 20, \
             "Some operations were lost (gap in log)"
 
+    @pytest.mark.skipif(httpx is None, reason="needs httpx")
     def test_system_handles_out_of_order_commits(self, server_urls, unique_scooter_id):
         """
         Out-of-order internal commits don't corrupt state.
@@ -182,45 +229,45 @@ class TestLogGaps:
         """
         # Create scooter
         create_scooter(server_urls[0], unique_scooter_id)
-        time.sleep(1)
-
-        # Concurrent operations from different servers
-        results = []
-        lock = threading.Lock()
+        wait_for_replication(server_urls, unique_scooter_id, timeout=1)
 
-        def do_operation(server_url, iteration):
+        async def do_operation(client, server_url, iteration):
+            scooter_url = f"{server_url}/scooters/{unique_scooter_id}"
             try:
                 # Only try if scooter is available
-                response = get_scooter(server_url, unique_scooter_id)
-                if response.status_code == 200 and response.json()["is_available"]:
-                    res = reserve_scooter(server_url, unique_scooter_id, f"ooo-{iteration}")
+                response = await client.get(scooter_url)
+                if response.status_code == 200 and parse_json(response)["is_available"]:
+                    res = await client.post(
+                        f"{scooter_url}/reservations",
+                        json={"reservation_id": f"ooo-{iteration}"}
+                    )
                     if res.status_code == 200:
-                        release_scooter(server_url, unique_scooter_id, 1)
-                        with lock:
-                            results.append(("success", iteration))
-            except Exception as e:
-                with lock:
-                    results.append(("error", str(e)))
-
-        # Launch operations from different servers
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            futures = []
-            for i in range(20):
-                server_url = server_urls[i % len(server_urls)]
-                futures.append(executor.submit(do_operation, server_url, i))
-            for f in as_completed(futures):
-                pass
-
-        # Wait for everything to settle
-        time.sleep(3)
+                        await client.post(f"{scooter_url}/releases", json={"distance": 1})
+                        return ("success", iteration)
+            except httpx.HTTPError as e:
+                return ("error", str(e))
+            return ("skipped", iteration)
+
+        async def run_all():
+            # Launch operations from different servers, all on one event loop
+            async with httpx.AsyncClient(timeout=60) as client:
+                return await asyncio.gather(*(
+                    do_operation(client, server_urls[i % len(server_urls)], i)
+                    for i in range(20)
+                ))
+
+        results = asyncio.run(run_all())
 
         # Count successes
         successes = sum(1 for r in results if r[0] == "success")
 
+        # Wait for everything to settle
+        wait_until(lambda: _replicas_agree(server_urls, unique_scooter_id, successes), timeout=3)
+
         # Final distance should equal number of successful operations
         response = get_scooter(server_urls[0], unique_scooter_id)
         if response.status_code == 200:
-            final_distance = response.json()["total_distance"]
+            final_distance = parse_json(response)["total_distance"]
             # Should match (or be close due to timing)
             # Not exact because some might have failed due to reservation conflicts
             assert final_distance >= 0, "Distance should not be negative"
@@ -231,91 +278,72 @@ class TestLogEntryTypes:
     Tests for different command types in the log.
     """
 
-    def test_create_command_in_log(self, api_url, unique_scooter_id):
-        """
-        CREATE commands are logged and applied correctly.
-        """
-        # Create
-        response = create_scooter(api_url, unique_scooter_id)
-        assert response.status_code in [200, 201]
+    @pytest.mark.parametrize("op,expected", [
+        ("create", {"is_available": True, "total_distance": 0}),
+        ("reserve", {"is_available": False}),
+        ("release", {"is_available": True, "total_distance": 77}),
+    ])
+    def test_command_in_log(self, request, api_url, unique_scooter_id, unique_reservation_id,
+                            op, expected):
+        """
+        CREATE, RESERVE and RELEASE commands are logged and applied correctly.
+
+        The create case goes through PUT /scooters/:id; the others start
+        from the prepared_scooter fixture.
+        """
+        if op == "create":
+            response = create_scooter(api_url, unique_scooter_id)
+            assert response.status_code == 200
+            scooter_id = unique_scooter_id
+        else:
+            scooter_id = request.getfixturevalue("prepared_scooter")
+            response = reserve_scooter(api_url, scooter_id, unique_reservation_id)
+            assert response.status_code == 200
+        if op == "release":
+            response = release_scooter(api_url, scooter_id, 77)
+            assert response.status_code == 200
 
         # Verify
-        response = get_scooter(api_url, unique_scooter_id)
-        assert response.status_code == 200
-        scooter = response.json()
-
-        # Initial state should be correct
-        assert scooter["id"] == unique_scooter_id
-        assert scooter["is_available"] == True
-        assert scooter["total_distance"] == 0
-
-    def test_reserve_command_in_log(self, api_url, unique_scooter_id, unique_reservation_id):
-        """
-        RESERVE commands are logged and applied correctly.
-        """
-        create_scooter(api_url, unique_scooter_id)
-
-        # Reserve
-        response = reserve_scooter(api_url, unique_scooter_id, unique_reservation_id)
-        assert response.status_code == 200
-
-        # Verify
-        response = get_scooter(api_url, unique_scooter_id)
-        scooter = response.json()
-        assert scooter["is_available"] == False
-        assert scooter["current_reservation_id"] == unique_reservation_id
-
-    def test_release_command_in_log(self, api_url, unique_scooter_id, unique_reservation_id):
-        """
-        RELEASE commands are logged and applied correctly.
-        """
-        create_scooter(api_url, unique_scooter_id)
-        reserve_scooter(api_url, unique_scooter_id, unique_reservation_id)
-
-        # Release with distance
-        response = release_scooter(api_url, unique_scooter_id, 77)
+        response = get_scooter(api_url, scooter_id)
         assert response.status_code == 200
+        scooter = parse_json(response)
+        assert scooter["id"] == scooter_id
+        for key, value in expected.items():
+            assert scooter[key] == value
 
-        # Verify
-        response = get_scooter(api_url, unique_scooter_id)
-        scooter = response.json()
-        assert scooter["is_available"] == True
-        assert scooter["total_distance"] == 77
-        # Reservation should be cleared
         res_id = scooter.get("current_reservation_id", "")
-        assert res_id == "" or res_id is None
+        if op == "reserve":
+            assert res_id == unique_reservation_id
+        else:
+            # No reservation yet, or it was cleared by the release
+            assert res_id == "" or res_id is None
 
-    def test_mixed_commands_correct_order(self, api_url, unique_scooter_id):
+    def test_mixed_commands_correct_order(self, api_url, prepared_scooter):
         """
         Different command types interleaved correctly in log order.
         """
-        # Create
-        create_scooter(api_url, unique_scooter_id)
-
         # Check initial state
-        response = get_scooter(api_url, unique_scooter_id)
-        assert response.json()["is_available"] == True
-        assert response.json()["total_distance"] == 0
+        scooter = parse_json(get_scooter(api_url, prepared_scooter))
+        assert scooter["is_available"] == True
+        assert scooter["total_distance"] == 0
 
         # Reserve
-        reserve_scooter(api_url, unique_scooter_id, "mixed-1")
-        response = get_scooter(api_url, unique_scooter_id)
-        assert response.json()["is_available"] == False
+        reserve_scooter(api_url, prepared_scooter, "mixed-1")
+        scooter = parse_json(get_scooter(api_url, prepared_scooter))
+        assert scooter["is_available"] == False
 
-        # Release with distance
-        release_scooter(api_url, unique_scooter_id, 10)
-        response = get_scooter(api_url, unique_scooter_id)
-        assert response.json()["is_available"] == True
-        assert response.json()["total_distance"] == 10
+        # Release with distance (the response carries the new state)
+        scooter = parse_json(release_scooter(api_url, prepared_scooter, 10))
+        assert scooter["is_available"] == True
+        assert scooter["total_distance"] == 10
 
         # Another round
-        reserve_scooter(api_url, unique_scooter_id, "mixed-2")
-        assert get_scooter(api_url, unique_scooter_id).json()["is_available"] == False
+        reserve_scooter(api_url, prepared_scooter, "mixed-2")
+        assert parse_json(get_scooter(api_url, prepared_scooter))["is_available"] == False
 
-        release_scooter(api_url, unique_scooter_id, 20)
-        response = get_scooter(api_url, unique_scooter_id)
-        assert response.json()["is_available"] == True
-        assert response.json()["total_distance"] == 30  # 10 + 20
+        scooter = parse_json(release_scooter(api_url, prepared_scooter, 20))
+        assert scooter["is_available"] == True
+        assert scooter["total_distance"] == 30  # 10 + 20
 
 
 class TestCommitIndexBehavior:
@@ -326,21 +354,20 @@ class TestCommitIndexBehavior:
     that committed entries are visible and uncommitted ones are not.
     """
 
-    def test_commit_advances_monotonically(self, api_url, unique_scooter_id):
+    def test_commit_advances_monotonically(self, api_url, prepared_scooter):
         """
         The committed state only moves forward.
 
         Distance should never decrease.
         """
-        create_scooter(api_url, unique_scooter_id)
-
+        reservations = [f"mono-{i}" for i in range(20)]
         last_distance = 0
-        for i in range(20):
-            reserve_scooter(api_url, unique_scooter_id, f"mono-{i}")
-            release_scooter(api_url, unique_scooter_id, 5)
+        for res_id in reservations:
+            reserve_scooter(api_url, prepared_scooter, res_id)
+            response = release_scooter(api_url, prepared_scooter, 5)
 
-            response = get_scooter(api_url, unique_scooter_id)
-            current_distance = response.json()["total_distance"]
+            # The release response carries the committed state
+            current_distance = parse_json(response)["total_distance"]
 
             # Should only go up
             assert current_distance >= last_distance, \
@@ -360,47 +387,40 @@ class TestCommitIndexBehavior:
             reserve_scooter(server_urls[0], unique_scooter_id, f"commit-{i}")
             release_scooter(server_urls[0], unique_scooter_id, 3)
 
-        # Wait for commit/replication
-        time.sleep(3)
-
         # All servers should have committed state
         expected = 30  # 10 * 3
 
-        for url in server_urls:
-            try:
-                response = get_scooter(url, unique_scooter_id)
-                if response.status_code == 200:
-                    distance = response.json()["total_distance"]
-                    assert distance == expected, \
-                        f"Server {url} has {distance}, expected {expected}"
-            except Exception:
-                pass
-
-    def test_uncommitted_not_visible(self, api_url, unique_scooter_id, unique_reservation_id):
+        # Wait for commit/replication
+        wait_until(lambda: _replicas_agree(server_urls, unique_scooter_id, expected))
+
+        for url, scooter in _read_scooters(server_urls, unique_scooter_id).items():
+            distance = scooter["total_distance"]
+            assert distance == expected, \
+                f"Server {url} has {distance}, expected {expected}"
+
+    def test_uncommitted_not_visible(self, api_url, prepared_scooter, unique_reservation_id):
         """
         Uncommitted entries should not be visible to reads.
 
         Once a write completes (returns success), it's committed and visible.
         Before that, intermediate states shouldn't leak.
         """
-        create_scooter(api_url, unique_scooter_id)
-
         # This test verifies that once we get a success response,
         # the state is committed and readable
-        reserve_scooter(api_url, unique_scooter_id, unique_reservation_id)
+        reserve_scooter(api_url, prepared_scooter, unique_reservation_id)
 
         # Immediately read - should see reserved state
         # (the write wouldn't return until committed)
-        response = get_scooter(api_url, unique_scooter_id)
-        assert response.json()["is_available"] == False, \
+        response = get_scooter(api_url, prepared_scooter)
+        assert parse_json(response)["is_available"] == False, \
             "Committed reservation not visible"
 
-        release_scooter(api_url, unique_scooter_id, 50)
+        release_scooter(api_url, prepared_scooter, 50)
 
         # Immediately read - should see released state
-        response = get_scooter(api_url, unique_scooter_id)
-        assert response.json()["is_available"] == True
-        assert response.json()["total_distance"] == 50
+        scooter = parse_json(get_scooter(api_url, prepared_scooter))
+        assert scooter["is_available"] == True
+        assert scooter["total_distance"] == 50
 
 
 class TestLogReplication:
@@ -408,84 +428,114 @@ class TestLogReplication:
     Tests for log replication across servers.
     """
 
-    def test_log_replicates_to_all_servers(self, server_urls, unique_scooter_id):
+    def test_log_replicates_to_all_servers(self, server_urls, shared_scooter):
         """
         Log entries replicate to all servers.
         """
+        baseline = parse_json(get_scooter(server_urls[0], shared_scooter))["total_distance"]
+        expected_distance = baseline + 100
+
         # Write to one server
-        create_scooter(server_urls[0], unique_scooter_id)
-        reserve_scooter(server_urls[0], unique_scooter_id, "replicate-test")
-        release_scooter(server_urls[0], unique_scooter_id, 100)
+        response = reserve_scooter(server_urls[0], shared_scooter, "replicate-test")
+        assert response.status_code == 200
+        response = release_scooter(server_urls[0], shared_scooter, 100)
+        assert response.status_code == 200
 
         # Wait for replication
-        time.sleep(3)
+        wait_until(lambda: sum(
+            1 for scooter in _read_scooters(server_urls, shared_scooter).values()
+            if scooter["total_distance"] == expected_distance
+        ) >= 3)
 
         # All servers should have the full log applied
         replicated_count = 0
-        for url in server_urls:
-            try:
-                response = get_scooter(url, unique_scooter_id)
-                if response.status_code == 200:
-                    scooter = response.json()
-                    if scooter["total_distance"] == 100:
-                        replicated_count += 1
-            except Exception:
-                pass
+        for scooter in _read_scooters(server_urls, shared_scooter).values():
+            if scooter["total_distance"] == expected_distance:
+                replicated_count += 1
 
         # At least majority should have it
         assert replicated_count >= 3, \
             f"Only {replicated_count} servers have replicated log"
 
-    def test_writes_from_any_server_replicate(self, server_urls, unique_scooter_id):
+    def test_writes_from_any_server_replicate(self, server_urls, shared_scooter):
         """
         Writes from any server replicate to all others.
         """
-        # Create from server 0
-        create_scooter(server_urls[0], unique_scooter_id)
-        time.sleep(1)
+        baseline = parse_json(get_scooter(server_urls[0], shared_scooter))["total_distance"]
+        expected_distance = baseline + 42
+
+        # Server 1 may still be applying an earlier test's writes to the
+        # shared scooter; it has to see the baseline before it can reserve
+        baseline_state = {"is_available": True, "total_distance": baseline}
+        assert wait_until(lambda: scooter_matches(
+            _read_scooter(server_urls[1], shared_scooter) or {}, baseline_state
+        )), "Server 1 never caught up with the shared scooter's baseline"
 
         # Reserve from server 1
-        reserve_scooter(server_urls[1], unique_scooter_id, "cross-server")
-        time.sleep(1)
+        response = reserve_scooter(server_urls[1], shared_scooter, "cross-server")
+        assert response.status_code == 200
+        wait_until(lambda: (_read_scooter(server_urls[2], shared_scooter) or {}).get("is_available") == False)
 
         # Release from server 2
-        release_scooter(server_urls[2], unique_scooter_id, 42)
-        time.sleep(2)
+        response = release_scooter(server_urls[2], shared_scooter, 42)
+        assert response.status_code == 200
+        wait_until(lambda: _replicas_agree(server_urls, shared_scooter, expected_distance))
 
         # All servers should have the final state
-        for url in server_urls:
-            try:
-                response = get_scooter(url, unique_scooter_id)
-                if response.status_code == 200:
-                    scooter = response.json()
-                    assert scooter["is_available"] == True
-                    assert scooter["total_distance"] == 42
-            except Exception:
-                pass
+        for scooter in _read_scooters(server_urls, shared_scooter).values():
+            assert scooter["is_available"] == True
+            assert scooter["total_distance"] == expected_distance
 
+    @pytest.mark.skipif(httpx is None, reason="needs httpx")
     def test_rapid_writes_all_replicate(self, api_url, server_urls, unique_scooter_id):
         """
         Many rapid writes all get replicated.
-        """
-        create_scooter(api_url, unique_scooter_id)
 
-        # Rapid operations
-        expected_distance = 0
-        for i in range(25):
-            reserve_scooter(api_url, unique_scooter_id, f"rapid-rep-{i}")
-            release_scooter(api_url, unique_scooter_id, 2)
-            expected_distance += 2
+        The writes are spread over several scooters so that several
+        proposals are in flight at once. Each scooter's own
+        reserve/release pairs still go in order.
+        """
+        lanes = [f"{unique_scooter_id}-lane-{k}" for k in range(5)]
+        for sid, result in zip(lanes, create_scooters_concurrently(api_url, lanes)):
+            assert getattr(result, "status_code", None) == 200, \
+                f"Create of {sid} failed: {result!r}"
+
+        async def run_lane(client, scooter_id):
+            scooter_url = f"{api_url}/scooters/{scooter_id}"
+            for i in range(5):
+                response = await client.post(
+                    f"{scooter_url}/reservations",
+                    json={"reservation_id": f"rapid-rep-{i}"}
+                )
+                assert response.status_code == 200, f"{scooter_id}: reserve {i} failed"
+                response = await client.post(f"{scooter_url}/releases", json={"distance": 2})
+                assert response.status_code == 200, f"{scooter_id}: release {i} failed"
+
+        async def run_all():
+            async with httpx.AsyncClient(timeout=60) as client:
+                await asyncio.gather(*(run_lane(client, sid) for sid in lanes))
+
+        # Rapid operations: 5 scooters x 5 reserve/release pairs
+        asyncio.run(run_all())
+        expected_distance = 5 * 2
+
+        def lanes_replicated():
+            per_server = _read_scooters_batch(server_urls, lanes).values()
+            for sid in lanes:
+                distances = [found[sid]["total_distance"] for found in per_server if sid in found]
+                if len(distances) < 3 or any(d != expected_distance for d in distances):
+                    return False
+            return True
 
         # Wait for replication
-        time.sleep(5)
-
-        # Check all servers
-        for url in server_urls:
-            try:
-                response = get_scooter(url, unique_scooter_id)
-                if response.status_code == 200:
-                    distance = response.json()["total_distance"]
-                    assert distance == expected_distance, \
-                        f"Server {url} has {distance}, expected {expected_distance}"
-            except Exception:
-                pass
+        assert wait_until(lanes_replicated), "Lanes did not replicate to a majority"
+
+        # Check all servers: every lane on a majority, each with every write
+        per_server = _read_scooters_batch(server_urls, lanes)
+        for sid in lanes:
+            holders = [url for url, found in per_server.items() if sid in found]
+            assert len(holders) >= 3, f"{sid} only on {len(holders)} servers"
+            for url in holders:
+                distance = per_server[url][sid]["total_distance"]
+                assert distance == expected_distance, \
+                    f"Server {url} has {distance} for {sid}, expected {expected_distance}"
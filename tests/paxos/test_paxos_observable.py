@@ -11,23 +11,112 @@ We can't test internal Paxos mechanics (proposal numbers, acceptor state, etc.)
 from the API, but we can observe the outcomes.
 
 Run with: pytest tests/paxos/test_paxos_observable.py -v
+Every test uses its own scooters, so the file can also be spread across
+pytest-xdist workers:
+    pytest tests/paxos/test_paxos_observable.py -n auto
 """
 
 import pytest
+import asyncio
 import time
-import sys
-import os
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import threading
+import uuid
+from concurrent.futures import as_completed
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from conftest import (
-    create_scooter, get_scooter, get_all_scooters,
-    reserve_scooter, release_scooter,
-    wait_for_replication, wait_for_server
+    create_scooter, get_scooter, get_scooter_all, get_all_scooters,
+    reserve_scooter, release_scooter, batch_operations, parse_json,
+    wait_for_replication, wait_for_server, wait_until, count_matching, quorum_reached,
+    WORKER_ID
 )
 
 
+@pytest.fixture(scope="module", autouse=True)
+def ensure_cluster_ready(reachable_servers):
+    """
+    Skip instead of running into timeouts when the cluster is down.
+
+    Every test here needs a quorum (3 of 5). The probe happens once per
+    session, and this check once per module. It runs before the
+    class-scoped setup writes below.
+    """
+    if len(reachable_servers) < 3:
+        pytest.skip(f"Only {len(reachable_servers)}/5 servers reachable, need a quorum")
+
+
+@pytest.fixture(scope="class")
+def released_scooter(server_urls):
+    """
+    A scooter that has been created, reserved and released once.
+
+    Shared by the read-only tests of a class, so the writes happen once
+    per class rather than once per test. They go in as a single batch
+    (one log entry), and the fixture waits until every server has applied
+    it (or the timeout passes, if a server is down).
+
+    Returns:
+        (scooter_id, reservation_id, distance)
+    """
+    scooter_id = f"scooter-{WORKER_ID}-{uuid.uuid4().hex[:8]}"
+    reservation_id = f"res-{WORKER_ID}-{uuid.uuid4().hex[:8]}"
+    distance = 100
+
+    response = batch_operations(server_urls[0], [
+        ("create", scooter_id),
+        ("reserve", scooter_id, reservation_id),
+        ("release", scooter_id, distance),
+    ])
+    assert response.status_code == 200, f"Setup batch failed: {response.status_code}"
+
+    wait_until(lambda: count_matching(
+        server_urls, scooter_id, lambda s: s["total_distance"] == distance
+    ) == len(server_urls), timeout=5)
+    return scooter_id, reservation_id, distance
+
+
+# Fields every scooter read must carry, whatever its state
+_REQUIRED_FIELDS = frozenset({"id", "is_available", "total_distance"})
+
+
+def _partial_state_problem(scooter):
+    """
+    What's wrong with a scooter's state, or None if it's complete and consistent.
+
+    Complete means all required fields are there. Consistent means an
+    available scooter has no reservation.
+    """
+    missing = _REQUIRED_FIELDS - scooter.keys()
+    if missing:
+        return f"missing fields {sorted(missing)}"
+    res_id = scooter.get("current_reservation_id")
+    if scooter["is_available"] and res_id:
+        return f"available but has reservation {res_id}"
+    return None
+
+
+def _read_concurrently(api_url, scooter_id, count, executor):
+    """
+    Read a scooter count times, all at once.
+
+    Uses one asyncio event loop with httpx if it's installed, otherwise
+    the shared thread pool. Returns the responses.
+    """
+    if httpx is None:
+        return list(executor.map(lambda _: get_scooter(api_url, scooter_id), range(count)))
+
+    async def read_all():
+        async with httpx.AsyncClient(timeout=60) as client:
+            return await asyncio.gather(
+                *(client.get(f"{api_url}/scooters/{scooter_id}") for _ in range(count))
+            )
+
+    return asyncio.run(read_all())
+
+
 class TestSingleValueConsensus:
     """
     Tests for basic single-value consensus.
@@ -48,26 +137,22 @@ class TestSingleValueConsensus:
         assert response.status_code in [200, 201], \
             f"Create failed: {response.status_code}"
 
-        # Wait a bit for replication
-        time.sleep(2)
+        # Wait for a quorum to apply it
+        wait_until(lambda: quorum_reached(server_urls, unique_scooter_id), timeout=5)
 
         # All servers should see the scooter
         servers_with_scooter = 0
-        for url in server_urls:
-            try:
-                response = get_scooter(url, unique_scooter_id)
-                if response.status_code == 200:
-                    servers_with_scooter += 1
-                    # Should have the same ID
-                    assert response.json()["id"] == unique_scooter_id
-            except Exception:
-                pass
+        for response in get_scooter_all(server_urls, unique_scooter_id).values():
+            if response is not None and response.status_code == 200:
+                servers_with_scooter += 1
+                # Should have the same ID
+                assert parse_json(response)["id"] == unique_scooter_id
 
         # At least a majority should have it (quorum)
         assert servers_with_scooter >= 3, \
             f"Only {servers_with_scooter}/5 servers have the scooter"
 
-    def test_consensus_value_persistence(self, api_url, unique_scooter_id, unique_reservation_id):
+    def test_consensus_value_persistence(self, api_url, unique_scooter_id, unique_reservation_id, executor):
         """
         Once consensus is reached, the value survives.
 
@@ -78,16 +163,16 @@ class TestSingleValueConsensus:
         reserve_scooter(api_url, unique_scooter_id, unique_reservation_id)
         release_scooter(api_url, unique_scooter_id, 100)
 
-        # Do multiple reads - all should see the same state
-        for i in range(10):
-            response = get_scooter(api_url, unique_scooter_id)
+        # Do multiple reads at once - all should see the same state
+        futures = [executor.submit(get_scooter, api_url, unique_scooter_id) for _ in range(10)]
+        for future in as_completed(futures):
+            response = future.result()
             assert response.status_code == 200
-            scooter = response.json()
+            scooter = parse_json(response)
             assert scooter["is_available"] == True
             assert scooter["total_distance"] == 100
-            time.sleep(0.1)
 
-    def test_consensus_concurrent_proposers_one_wins(self, api_url, unique_scooter_id):
+    def test_consensus_concurrent_proposers_one_wins(self, api_url, unique_scooter_id, executor):
         """
         Two concurrent writes to the same key - one value must be decided.
 
@@ -103,21 +188,20 @@ class TestSingleValueConsensus:
                 return e
 
         # Launch two concurrent creates
-        with ThreadPoolExecutor(max_workers=2) as executor:
-            f1 = executor.submit(try_create)
-            f2 = executor.submit(try_create)
-            results.append(f1.result())
-            results.append(f2.result())
+        f1 = executor.submit(try_create)
+        f2 = executor.submit(try_create)
+        results.append(f1.result())
+        results.append(f2.result())
 
         # At least one should succeed
         successes = [r for r in results if hasattr(r, 'status_code') and r.status_code in [200, 201]]
         assert len(successes) >= 1, "No create succeeded"
 
         # The scooter should exist with consistent state
-        time.sleep(1)
+        wait_until(lambda: get_scooter(api_url, unique_scooter_id).status_code == 200, timeout=2)
         response = get_scooter(api_url, unique_scooter_id)
         assert response.status_code == 200
-        assert response.json()["id"] == unique_scooter_id
+        assert parse_json(response)["id"] == unique_scooter_id
 
 
 class TestConsensusSafety:
@@ -127,7 +211,7 @@ class TestConsensusSafety:
     Safety means: once a value is decided, it cannot change.
     """
 
-    def test_decided_value_never_changes(self, api_url, unique_scooter_id, unique_reservation_id):
+    def test_decided_value_never_changes(self, api_url, unique_scooter_id, unique_reservation_id, executor):
         """
         Once a value is set via consensus, it stays set.
 
@@ -139,45 +223,33 @@ class TestConsensusSafety:
         # Reserve the scooter (sets is_available=False)
         reserve_scooter(api_url, unique_scooter_id, unique_reservation_id)
 
-        # Multiple reads should all see reserved state
+        # Many concurrent reads should all see reserved state
         # This tests that the decided value doesn't flip
-        for i in range(20):
-            response = get_scooter(api_url, unique_scooter_id)
-            scooter = response.json()
+        responses = _read_concurrently(api_url, unique_scooter_id, 50, executor)
+        for i, response in enumerate(responses):
+            scooter = parse_json(response)
             assert scooter["is_available"] == False, \
                 f"Read {i}: decided value changed unexpectedly"
             assert scooter["current_reservation_id"] == unique_reservation_id
-            time.sleep(0.05)
 
-    def test_all_nodes_agree_on_value(self, server_urls, unique_scooter_id, unique_reservation_id):
+    def test_all_nodes_agree_on_value(self, server_urls, released_scooter):
         """
         All servers return the same value after consensus.
         """
-        # Create and reserve on one server
-        create_scooter(server_urls[0], unique_scooter_id)
-        time.sleep(1)
-        reserve_scooter(server_urls[0], unique_scooter_id, unique_reservation_id)
-        release_scooter(server_urls[0], unique_scooter_id, 42)
-
-        # Wait for replication
-        time.sleep(3)
+        scooter_id, _, _ = released_scooter
 
         # Query all servers
         values = []
-        for url in server_urls:
-            try:
-                response = get_scooter(url, unique_scooter_id)
-                if response.status_code == 200:
-                    values.append(response.json()["total_distance"])
-            except Exception:
-                pass
+        for response in get_scooter_all(server_urls, scooter_id).values():
+            if response is not None and response.status_code == 200:
+                values.append(parse_json(response)["total_distance"])
 
         # All responding servers should agree
         if len(values) >= 2:
             assert all(v == values[0] for v in values), \
                 f"Servers disagree on value: {values}"
 
-    def test_no_partial_state(self, api_url, unique_scooter_id, unique_reservation_id):
+    def test_no_partial_state(self, api_url, released_scooter, executor):
         """
         We should never see incomplete/partial writes.
 
@@ -187,34 +259,14 @@ class TestConsensusSafety:
 
         We should never see weird partial states.
         """
-        # Create scooter
-        create_scooter(api_url, unique_scooter_id)
-
-        # Do some state changes
-        reserve_scooter(api_url, unique_scooter_id, unique_reservation_id)
-        release_scooter(api_url, unique_scooter_id, 100)
-
-        # Multiple reads - each should have complete state
-        for i in range(20):
-            response = get_scooter(api_url, unique_scooter_id)
-            assert response.status_code == 200
-
-            scooter = response.json()
+        scooter_id, _, _ = released_scooter
 
-            # All fields should be present
-            assert "id" in scooter
-            assert "is_available" in scooter
-            assert "total_distance" in scooter
+        # Many concurrent reads - each should have complete state
+        responses = _read_concurrently(api_url, scooter_id, 50, executor)
+        assert all(r.status_code == 200 for r in responses)
 
-            # State should be consistent
-            # If available, no reservation
-            if scooter["is_available"]:
-                # current_reservation_id should be empty or absent
-                res_id = scooter.get("current_reservation_id", "")
-                assert res_id == "" or res_id is None, \
-                    f"Inconsistent: available but has reservation {res_id}"
-
-            time.sleep(0.05)
+        problems = [p for p in map(_partial_state_problem, map(parse_json, responses)) if p]
+        assert not problems, f"Inconsistent reads: {problems}"
 
 
 class TestDuelingProposers:
@@ -225,7 +277,7 @@ class TestDuelingProposers:
     eventually reach consensus on a single value.
     """
 
-    def test_concurrent_conflicting_writes(self, server_urls, unique_scooter_id):
+    def test_concurrent_conflicting_writes(self, server_urls, unique_scooter_id, executor):
         """
         Two clients write the same key from different servers.
 
@@ -240,28 +292,23 @@ class TestDuelingProposers:
                 return (url, e)
 
         # Create from two different servers simultaneously
-        with ThreadPoolExecutor(max_workers=2) as executor:
-            f1 = executor.submit(try_create, server_urls[0])
-            f2 = executor.submit(try_create, server_urls[1])
-            results.append(f1.result())
-            results.append(f2.result())
+        f1 = executor.submit(try_create, server_urls[0])
+        f2 = executor.submit(try_create, server_urls[1])
+        results.append(f1.result())
+        results.append(f2.result())
 
         # At least one should succeed
         successes = [r for r in results if hasattr(r[1], 'status_code') and r[1].status_code in [200, 201]]
         assert len(successes) >= 1
 
         # Wait for consistency
-        time.sleep(2)
+        wait_until(lambda: quorum_reached(server_urls, unique_scooter_id), timeout=5)
 
         # All servers should agree on existence and state
         scooter_states = []
-        for url in server_urls:
-            try:
-                response = get_scooter(url, unique_scooter_id)
-                if response.status_code == 200:
-                    scooter_states.append(response.json())
-            except Exception:
-                pass
+        for response in get_scooter_all(server_urls, unique_scooter_id).values():
+            if response is not None and response.status_code == 200:
+                scooter_states.append(parse_json(response))
 
         # All should have the same state
         if len(scooter_states) >= 2:
@@ -270,7 +317,7 @@ class TestDuelingProposers:
                 assert state["id"] == first["id"]
                 assert state["is_available"] == first["is_available"]
 
-    def test_rapid_conflicting_proposals(self, api_url, unique_scooter_id):
+    def test_rapid_conflicting_proposals(self, api_url, unique_scooter_id, executor):
         """
         Many rapid proposals - system should stay consistent.
 
@@ -279,35 +326,27 @@ class TestDuelingProposers:
         """
         # Create the scooter
         create_scooter(api_url, unique_scooter_id)
-        time.sleep(1)
-
-        results = []
-        lock = threading.Lock()
 
         def try_reserve(client_id):
             try:
                 response = reserve_scooter(api_url, unique_scooter_id, f"rapid-{client_id}")
-                with lock:
-                    results.append((client_id, response.status_code))
+                return (client_id, response.status_code)
             except Exception as e:
-                with lock:
-                    results.append((client_id, str(e)))
+                return (client_id, str(e))
 
         # 10 concurrent reservation attempts
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            futures = [executor.submit(try_reserve, i) for i in range(10)]
-            for f in as_completed(futures):
-                pass
+        futures = [executor.submit(try_reserve, i) for i in range(10)]
+        results = [f.result() for f in futures]
 
         # One should have won
         successes = [r for r in results if r[1] == 200]
         assert len(successes) >= 1, "No reservation succeeded"
 
         # The scooter should be reserved
-        response = get_scooter(api_url, unique_scooter_id)
-        assert response.json()["is_available"] == False
+        scooter = parse_json(get_scooter(api_url, unique_scooter_id))
+        assert scooter["is_available"] == False
         # Should have one of the rapid-X reservations
-        res_id = response.json()["current_reservation_id"]
+        res_id = scooter["current_reservation_id"]
         assert res_id.startswith("rapid-")
 
     def test_dueling_proposers_eventually_succeed(self, api_url, unique_scooter_id):
@@ -318,10 +357,10 @@ class TestDuelingProposers:
         with concurrent proposers.
         """
         create_scooter(api_url, unique_scooter_id)
-        time.sleep(0.5)
 
         # Do 5 rounds of reserve/release with some concurrent pressure
         successful_rounds = 0
+        backoff = 0.01
 
         for round_num in range(5):
             # Try to reserve
@@ -331,7 +370,10 @@ class TestDuelingProposers:
                 rel_response = release_scooter(api_url, unique_scooter_id, 10)
                 if rel_response.status_code == 200:
                     successful_rounds += 1
-            time.sleep(0.2)
+                    continue
+            # Back off only after a failed round, like a client under contention
+            time.sleep(backoff)
+            backoff = min(backoff * 2, 0.5)
 
         # Should complete at least some rounds
         assert successful_rounds >= 3, \
@@ -339,7 +381,7 @@ class TestDuelingProposers:
 
         # Final state should reflect successful operations
         response = get_scooter(api_url, unique_scooter_id)
-        assert response.json()["total_distance"] == successful_rounds * 10
+        assert parse_json(response)["total_distance"] == successful_rounds * 10
 
 
 class TestQuorumBehavior:
@@ -350,38 +392,26 @@ class TestQuorumBehavior:
     servers respond, but we can observe quorum-based behavior.
     """
 
-    def test_write_succeeds_with_all_servers(self, api_url, unique_scooter_id):
-        """
-        Write succeeds when all servers are up.
-
-        This is the baseline - full cluster should work.
-        """
-        response = create_scooter(api_url, unique_scooter_id)
-        assert response.status_code in [200, 201]
-
-        response = get_scooter(api_url, unique_scooter_id)
-        assert response.status_code == 200
-
-    def test_read_after_quorum_write(self, server_urls, unique_scooter_id):
+    def test_read_after_write(self, server_urls, unique_scooter_id):
         """
         After a write succeeds (quorum acknowledged), reads should see it.
+
+        The server that took the write sees it at once, and at least a
+        majority of servers see it after replication.
         """
         # Write
         response = create_scooter(server_urls[0], unique_scooter_id)
         assert response.status_code in [200, 201], "Write should succeed"
 
+        # The server that took the write has it before replication
+        response = get_scooter(server_urls[0], unique_scooter_id)
+        assert response.status_code == 200
+
         # Wait for replication
-        time.sleep(2)
+        wait_until(lambda: quorum_reached(server_urls, unique_scooter_id), timeout=5)
 
-        # Multiple reads from different servers
-        successful_reads = 0
-        for url in server_urls:
-            try:
-                response = get_scooter(url, unique_scooter_id)
-                if response.status_code == 200:
-                    successful_reads += 1
-            except Exception:
-                pass
+        # Reads from every server at once
+        successful_reads = count_matching(server_urls, unique_scooter_id, timeout=60)
 
         # At least a quorum should have the value
         assert successful_reads >= 3, \
@@ -393,22 +423,19 @@ class TestQuorumBehavior:
         """
         # Do operations
         create_scooter(server_urls[0], unique_scooter_id)
-        time.sleep(1)
         reserve_scooter(server_urls[0], unique_scooter_id, unique_reservation_id)
         release_scooter(server_urls[0], unique_scooter_id, 55)
 
         # Wait for replication
-        time.sleep(3)
+        wait_until(lambda: quorum_reached(
+            server_urls, unique_scooter_id, lambda s: s["total_distance"] == 55
+        ), timeout=5)
 
         # Check all servers
         distances = []
-        for url in server_urls:
-            try:
-                response = get_scooter(url, unique_scooter_id)
-                if response.status_code == 200:
-                    distances.append(response.json()["total_distance"])
-            except Exception:
-                pass
+        for response in get_scooter_all(server_urls, unique_scooter_id).values():
+            if response is not None and response.status_code == 200:
+                distances.append(parse_json(response)["total_distance"])
 
         # At least 3 (majority) should have the same value
         if len(distances) >= 3:
@@ -431,25 +458,20 @@ class TestConsensusWithStateChanges:
         After successful reserve, all servers should see reserved state.
         """
         create_scooter(api_url, unique_scooter_id)
-        time.sleep(1)
 
         # Reserve
         response = reserve_scooter(api_url, unique_scooter_id, unique_reservation_id)
         assert response.status_code == 200
 
         # Wait for replication
-        time.sleep(2)
+        wait_until(lambda: quorum_reached(
+            server_urls, unique_scooter_id, lambda s: not s["is_available"]
+        ), timeout=5)
 
         # Check all servers
-        reserved_count = 0
-        for url in server_urls:
-            try:
-                response = get_scooter(url, unique_scooter_id)
-                if response.status_code == 200:
-                    if not response.json()["is_available"]:
-                        reserved_count += 1
-            except Exception:
-                pass
+        reserved_count = count_matching(
+            server_urls, unique_scooter_id, lambda s: not s["is_available"], timeout=60
+        )
 
         # At least majority should show reserved
         assert reserved_count >= 3, \
@@ -462,25 +484,22 @@ class TestConsensusWithStateChanges:
         After successful release, all servers should see new distance.
         """
         create_scooter(api_url, unique_scooter_id)
-        reserve_scooter(api_url, unique_scooter_id, unique_reservation_id)
+        response = reserve_scooter(api_url, unique_scooter_id, unique_reservation_id)
+        assert response.status_code == 200
 
         # Release with specific distance
         response = release_scooter(api_url, unique_scooter_id, 123)
         assert response.status_code == 200
 
         # Wait for replication
-        time.sleep(2)
+        wait_until(lambda: quorum_reached(
+            server_urls, unique_scooter_id, lambda s: s["total_distance"] == 123
+        ), timeout=5)
 
         # Check all servers
-        correct_distance_count = 0
-        for url in server_urls:
-            try:
-                response = get_scooter(url, unique_scooter_id)
-                if response.status_code == 200:
-                    if response.json()["total_distance"] == 123:
-                        correct_distance_count += 1
-            except Exception:
-                pass
+        correct_distance_count = count_matching(
+            server_urls, unique_scooter_id, lambda s: s["total_distance"] == 123, timeout=60
+        )
 
         # At least majority should have correct distance
         assert correct_distance_count >= 3, \
@@ -504,7 +523,7 @@ class TestConsensusWithStateChanges:
 
             # Verify reserved
             response = get_scooter(api_url, unique_scooter_id)
-            assert response.json()["is_available"] == False
+            assert parse_json(response)["is_available"] == False
 
             # Release (round N+1)
             distance = (i + 1) * 10
@@ -513,6 +532,6 @@ class TestConsensusWithStateChanges:
             total_distance += distance
 
             # Verify released with correct distance
-            response = get_scooter(api_url, unique_scooter_id)
-            assert response.json()["is_available"] == True
-            assert response.json()["total_distance"] == total_distance
+            scooter = parse_json(get_scooter(api_url, unique_scooter_id))
+            assert scooter["is_available"] == True
+            assert scooter["total_distance"] == total_distance
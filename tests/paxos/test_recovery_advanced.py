@@ -9,108 +9,130 @@ These tests verify sophisticated recovery scenarios:
 - State reconstruction correctness
 
 Run with: pytest tests/paxos/test_recovery_advanced.py -v
+Each test works on its own scooters (the module's prebuilt scooter is
+built once per worker), so the classes can run in parallel:
+    pytest tests/paxos/test_recovery_advanced.py -n 8
 """
 
 import pytest
-import time
-import sys
-import os
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import threading
+import requests
+import uuid
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from conftest import (
-    create_scooter, get_scooter, get_all_scooters,
-    reserve_scooter, release_scooter, take_snapshot,
-    wait_for_replication, wait_for_server
+    create_scooter, create_scooters_bulk, get_scooter, get_scooter_all, get_all_scooters,
+    reserve_scooter, release_scooter, take_snapshot, parse_json,
+    get_scooters_batch, wait_until, count_matching, WORKER_ID
 )
 
 
+def _wait_all_match(server_urls, scooter_id, predicate, timeout):
+    """
+    Wait until every listed server's copy of the scooter matches.
+
+    Returns as soon as they do. The timeout is the fixed wait these
+    tests used to sleep for, so if a replica is down the worst case is
+    unchanged.
+
+    Returns:
+        Dict of url -> scooter from the last poll, for the servers that
+        had it, so callers can assert on it without fetching again
+    """
+    states = {}
+
+    def all_match():
+        responses = get_scooter_all(server_urls, scooter_id, timeout=1.0)
+        states.clear()
+        states.update({
+            url: parse_json(response) for url, response in responses.items()
+            if response is not None and response.status_code == 200
+        })
+        return len(states) == len(server_urls) and all(map(predicate, states.values()))
+
+    wait_until(all_match, timeout=timeout)
+    return states
+
+
+@pytest.fixture(scope="module")
+def prebuilt_scooter(server_urls):
+    """
+    A scooter with a history of 21 log entries, shared by the tests that
+    build on a replicated history.
+
+    Created and ridden 10 times on server 0. The fixture waits (up to 5s)
+    for every server to apply it all.
+
+    Returns:
+        Dict with the scooter's "id" and its current "total_distance".
+        Tests that add rentals update the total, so later tests don't
+        depend on running order.
+    """
+    scooter_id = f"shared-{WORKER_ID}-{uuid.uuid4().hex[:8]}"
+    primary = server_urls[0]
+    response = create_scooter(primary, scooter_id)
+    assert response.status_code == 200, f"Setup create failed: {response.status_code}"
+    for rid in [f"prebuilt-{i}" for i in range(10)]:
+        response = reserve_scooter(primary, scooter_id, rid)
+        assert response.status_code == 200, f"Setup reserve {rid} failed: {response.status_code}"
+        response = release_scooter(primary, scooter_id, 5)
+        assert response.status_code == 200, f"Setup release {rid} failed: {response.status_code}"
+
+    expected = 50  # 10 * 5
+    _wait_all_match(server_urls, scooter_id,
+                    lambda s: s["total_distance"] == expected, timeout=5)
+    return {"id": scooter_id, "total_distance": expected}
+
+
 class TestRecoveryProtocol:
     """
     Tests for the recovery protocol.
     """
 
-    def test_recovering_node_catches_up(self, server_urls, unique_scooter_id):
+    def test_recovering_nodes_rebuild_from_log(self, server_urls, prebuilt_scooter):
         """
-        A node that was behind catches up with all missed entries.
+        Nodes that were behind replay the missed log entries (no snapshot)
+        and rebuild the same state machine as the node that took the writes.
         """
-        # Create data on one server
-        create_scooter(server_urls[0], unique_scooter_id)
-        for i in range(10):
-            reserve_scooter(server_urls[0], unique_scooter_id, f"catchup-{i}")
-            release_scooter(server_urls[0], unique_scooter_id, 7)
+        # Data was written on server 0 only
+        scooter_id, expected = prebuilt_scooter["id"], prebuilt_scooter["total_distance"]
 
-        # Wait for replication (recovery)
-        time.sleep(5)
+        rebuilt = 0
+        for url, response in get_scooter_all(server_urls, scooter_id).items():
+            if response is None or response.status_code != 200:
+                continue
+            scooter = parse_json(response)
+            # Every server that answers has the full history applied, in order
+            assert scooter["total_distance"] == expected, \
+                f"{url} rebuilt distance {scooter['total_distance']}, expected {expected}"
+            assert scooter["is_available"] == True, f"{url} left the scooter reserved"
+            if url != server_urls[0]:
+                rebuilt += 1
 
-        # Other servers should have caught up
-        expected = 70  # 10 * 7
-
-        caught_up = 0
-        for url in server_urls[1:]:
-            try:
-                response = get_scooter(url, unique_scooter_id)
-                if response.status_code == 200:
-                    if response.json()["total_distance"] == expected:
-                        caught_up += 1
-            except Exception:
-                pass
-
-        assert caught_up >= 2, f"Only {caught_up} servers caught up"
+        # At least a quorum's worth of the other servers caught up
+        assert rebuilt >= 2, f"Only {rebuilt} servers caught up"
 
     def test_recovery_from_snapshot(self, server_urls, unique_scooter_id):
         """
         Node can recover state from snapshot.
         """
         # Build up significant state
-        create_scooter(server_urls[0], unique_scooter_id)
-        for i in range(20):
-            reserve_scooter(server_urls[0], unique_scooter_id, f"snap-rec-{i}")
-            release_scooter(server_urls[0], unique_scooter_id, 3)
+        primary = server_urls[0]
+        create_scooter(primary, unique_scooter_id)
+        for rid in [f"snap-rec-{i}" for i in range(20)]:
+            reserve_scooter(primary, unique_scooter_id, rid)
+            release_scooter(primary, unique_scooter_id, 3)
 
         # Take snapshot
-        take_snapshot(server_urls[0])
-        time.sleep(5)
+        take_snapshot(primary)
 
         # Other servers should recover via snapshot
         expected = 60  # 20 * 3
+        states = _wait_all_match(server_urls[1:], unique_scooter_id,
+                                 lambda s: s["total_distance"] == expected, timeout=5)
 
-        for url in server_urls[1:]:
-            try:
-                response = get_scooter(url, unique_scooter_id)
-                if response.status_code == 200:
-                    distance = response.json()["total_distance"]
-                    assert distance == expected, \
-                        f"Server recovered wrong state: {distance}"
-            except Exception:
-                pass
-
-    def test_recovery_from_log_only(self, server_urls, unique_scooter_id):
-        """
-        Node can recover state by replaying log (no snapshot).
-        """
-        # Create data without snapshot
-        create_scooter(server_urls[0], unique_scooter_id)
-        for i in range(5):
-            reserve_scooter(server_urls[0], unique_scooter_id, f"log-only-{i}")
-            release_scooter(server_urls[0], unique_scooter_id, 8)
-
-        # Wait for log replication
-        time.sleep(3)
-
-        # Should have replicated
-        expected = 40  # 5 * 8
-
-        for url in server_urls[1:]:
-            try:
-                response = get_scooter(url, unique_scooter_id)
-                if response.status_code == 200:
-                    assert response.json()["total_distance"] == expected
-                    break
-            except Exception:
-                pass
-
+        for scooter in states.values():
+            distance = scooter["total_distance"]
+            assert distance == expected, \
+                f"Server recovered wrong state: {distance}"
 
 class TestRecoveryDuringOperations:
     """
@@ -119,54 +141,56 @@ class TestRecoveryDuringOperations:
 
     def test_operations_continue_during_recovery(self, server_urls, unique_scooter_id):
         """
-        System continues to work while a node is recovering.
+        System continues to work while a node is recovering, and active
+        nodes aren't blocked by the recovery.
         """
         # Create scooter
-        create_scooter(server_urls[0], unique_scooter_id)
-        time.sleep(1)
+        primary = server_urls[0]
+        create_scooter(primary, unique_scooter_id)
 
         # Concurrent operations while recovery might be happening
         successes = 0
-        for i in range(20):
+        for rid in [f"during-rec-{i}" for i in range(20)]:
             try:
-                res = reserve_scooter(server_urls[0], unique_scooter_id, f"during-rec-{i}")
+                res = reserve_scooter(primary, unique_scooter_id, rid)
                 if res.status_code == 200:
-                    rel = release_scooter(server_urls[0], unique_scooter_id, 2)
+                    rel = release_scooter(primary, unique_scooter_id, 2)
                     if rel.status_code == 200:
                         successes += 1
-            except Exception:
-                pass
+            except requests.exceptions.RequestException:
+                continue
 
-        # Most should succeed
-        assert successes >= 15, f"Only {successes} operations succeeded"
+        # Nearly all should succeed; recovering nodes must not block the
+        # active ones
+        assert successes >= 18, f"Only {successes} operations succeeded (expected ~20)"
 
         # Final state should reflect successes
-        response = get_scooter(server_urls[0], unique_scooter_id)
-        assert response.json()["total_distance"] == successes * 2
+        response = get_scooter(primary, unique_scooter_id)
+        assert parse_json(response)["total_distance"] == successes * 2
 
-    def test_new_writes_replicate_to_recovering_node(self, server_urls, unique_scooter_id):
+    def test_new_writes_replicate_to_recovering_node(self, server_urls, prebuilt_scooter,
+                                                     unique_reservation_id):
         """
         New writes should eventually reach all nodes, including recovering ones.
         """
-        # Create and do operations
-        create_scooter(server_urls[0], unique_scooter_id)
-        for i in range(10):
-            reserve_scooter(server_urls[0], unique_scooter_id, f"replicate-{i}")
-            release_scooter(server_urls[0], unique_scooter_id, 5)
-
-        # Wait for replication
-        time.sleep(5)
-
-        # All servers should eventually have the writes
-        expected = 50
-
-        for url in server_urls:
-            try:
-                response = get_scooter(url, unique_scooter_id)
-                if response.status_code == 200:
-                    assert response.json()["total_distance"] == expected
-            except Exception:
-                pass
+        # A new rental on top of the replicated history
+        scooter_id = prebuilt_scooter["id"]
+        primary = server_urls[0]
+        response = reserve_scooter(primary, scooter_id, unique_reservation_id)
+        assert response.status_code == 200
+        response = release_scooter(primary, scooter_id, 7)
+        assert response.status_code == 200
+        prebuilt_scooter["total_distance"] += 7
+        expected = prebuilt_scooter["total_distance"]
+
+        # All servers should eventually have the new write
+        states = _wait_all_match(server_urls, scooter_id,
+                                 lambda s: s["total_distance"] == expected, timeout=5)
+        assert len(states) == len(server_urls), \
+            f"Only {len(states)}/{len(server_urls)} servers answered"
+        for url, scooter in states.items():
+            assert scooter["total_distance"] == expected, \
+                f"{url} has {scooter['total_distance']}, expected {expected}"
 
     def test_reads_from_recovered_node(self, server_urls, unique_scooter_id, unique_reservation_id):
         """
@@ -178,20 +202,15 @@ class TestRecoveryDuringOperations:
         release_scooter(server_urls[0], unique_scooter_id, 99)
 
         # Wait for replication
-        time.sleep(3)
+        states = _wait_all_match(server_urls[1:], unique_scooter_id,
+                                 lambda s: s["total_distance"] == 99, timeout=3)
 
         # Should be able to read from other servers
-        for url in server_urls[1:]:
-            try:
-                response = get_scooter(url, unique_scooter_id)
-                if response.status_code == 200:
-                    scooter = response.json()
-                    assert scooter["total_distance"] == 99
-                    assert scooter["is_available"] == True
-                    # Found a recovered node that serves reads
-                    return
-            except Exception:
-                pass
+        for scooter in states.values():
+            assert scooter["total_distance"] == 99
+            assert scooter["is_available"] == True
+            # Found a recovered node that serves reads
+            return
 
 
 class TestPartialFailures:
@@ -204,32 +223,31 @@ class TestPartialFailures:
         Node with some entries gets the rest.
         """
         # Create initial data
-        create_scooter(server_urls[0], unique_scooter_id)
-        for i in range(5):
-            reserve_scooter(server_urls[0], unique_scooter_id, f"partial-1-{i}")
-            release_scooter(server_urls[0], unique_scooter_id, 10)
+        primary = server_urls[0]
+        create_scooter(primary, unique_scooter_id)
+        for rid in [f"partial-1-{i}" for i in range(5)]:
+            reserve_scooter(primary, unique_scooter_id, rid)
+            release_scooter(primary, unique_scooter_id, 10)
 
-        # Wait for partial replication
-        time.sleep(2)
+        # Wait for partial replication (a quorum has the first half)
+        wait_until(lambda: count_matching(
+            server_urls, unique_scooter_id, lambda s: s["total_distance"] == 50
+        ) >= 3, timeout=2)
 
         # More data
-        for i in range(5):
-            reserve_scooter(server_urls[0], unique_scooter_id, f"partial-2-{i}")
-            release_scooter(server_urls[0], unique_scooter_id, 10)
-
-        # Wait for full replication
-        time.sleep(3)
+        for rid in [f"partial-2-{i}" for i in range(5)]:
+            reserve_scooter(primary, unique_scooter_id, rid)
+            release_scooter(primary, unique_scooter_id, 10)
 
         # Should have all data: 10 * 10 = 100
         expected = 100
 
-        for url in server_urls[1:]:
-            try:
-                response = get_scooter(url, unique_scooter_id)
-                if response.status_code == 200:
-                    assert response.json()["total_distance"] == expected
-            except Exception:
-                pass
+        # Wait for full replication
+        states = _wait_all_match(server_urls[1:], unique_scooter_id,
+                                 lambda s: s["total_distance"] == expected, timeout=3)
+
+        for scooter in states.values():
+            assert scooter["total_distance"] == expected
 
     def test_recovery_after_crash_during_write(self, api_url, server_urls, unique_scooter_id):
         """
@@ -246,12 +264,10 @@ class TestPartialFailures:
             if response.status_code == 200:
                 release_scooter(api_url, unique_scooter_id, 5)
 
-        # Wait
-        time.sleep(2)
-
-        # State should be consistent
+        # State should be consistent (the server that took the writes
+        # applied each one before responding)
         response = get_scooter(api_url, unique_scooter_id)
-        distance = response.json()["total_distance"]
+        distance = parse_json(response)["total_distance"]
         assert distance == 50  # All 10 should have completed
 
     def test_recovery_preserves_accepted_state(self, server_urls, unique_scooter_id, unique_reservation_id):
@@ -265,18 +281,14 @@ class TestPartialFailures:
         release_scooter(server_urls[0], unique_scooter_id, 77)
 
         # Wait for replication
-        time.sleep(3)
+        states = _wait_all_match(server_urls, unique_scooter_id,
+                                 lambda s: s["total_distance"] == 77, timeout=3)
 
         # Check multiple servers - all should have the accepted state
         correct_count = 0
-        for url in server_urls:
-            try:
-                response = get_scooter(url, unique_scooter_id)
-                if response.status_code == 200:
-                    if response.json()["total_distance"] == 77:
-                        correct_count += 1
-            except Exception:
-                pass
+        for scooter in states.values():
+            if scooter["total_distance"] == 77:
+                correct_count += 1
 
         assert correct_count >= 3, f"Only {correct_count} servers have accepted state"
 
@@ -286,125 +298,37 @@ class TestMultipleNodeRecovery:
     Tests for multiple nodes recovering.
     """
 
-    def test_two_nodes_recover_simultaneously(self, server_urls, unique_scooter_id):
-        """
-        Two nodes can recover at the same time without conflict.
-        """
-        # Create data
-        create_scooter(server_urls[0], unique_scooter_id)
-        for i in range(15):
-            reserve_scooter(server_urls[0], unique_scooter_id, f"dual-rec-{i}")
-            release_scooter(server_urls[0], unique_scooter_id, 4)
-
-        # Wait for both to recover
-        time.sleep(5)
-
-        # Both should have recovered correctly
-        expected = 60  # 15 * 4
-
-        recovered = 0
-        for url in server_urls[1:3]:  # Check servers 1 and 2
-            try:
-                response = get_scooter(url, unique_scooter_id)
-                if response.status_code == 200:
-                    if response.json()["total_distance"] == expected:
-                        recovered += 1
-            except Exception:
-                pass
-
-        assert recovered >= 1, "Neither node recovered correctly"
-
     def test_staggered_recovery(self, server_urls, unique_scooter_id):
         """
         Nodes recovering at different times all end up consistent.
         """
         # Create data in batches
-        create_scooter(server_urls[0], unique_scooter_id)
+        primary = server_urls[0]
+        create_scooter(primary, unique_scooter_id)
 
         for batch in range(3):
-            for i in range(5):
-                reserve_scooter(server_urls[0], unique_scooter_id, f"stagger-{batch}-{i}")
-                release_scooter(server_urls[0], unique_scooter_id, 3)
-            time.sleep(1)  # Stagger
-
-        # Wait for all to recover
-        time.sleep(5)
+            for rid in [f"stagger-{batch}-{i}" for i in range(5)]:
+                reserve_scooter(primary, unique_scooter_id, rid)
+                release_scooter(primary, unique_scooter_id, 3)
 
         # All should converge
         expected = 45  # 3 batches * 5 ops * 3 distance
 
-        distances = []
-        for url in server_urls:
-            try:
-                response = get_scooter(url, unique_scooter_id)
-                if response.status_code == 200:
-                    distances.append(response.json()["total_distance"])
-            except Exception:
-                pass
+        # Wait for all to recover
+        states = _wait_all_match(server_urls, unique_scooter_id,
+                                 lambda s: s["total_distance"] == expected, timeout=5)
 
         # All should have same value
-        for d in distances:
+        for scooter in states.values():
+            d = scooter["total_distance"]
             assert d == expected, f"Server has inconsistent distance: {d}"
 
-    def test_recovery_while_other_nodes_active(self, server_urls, unique_scooter_id):
-        """
-        Active nodes aren't blocked by recovery of other nodes.
-        """
-        # Create scooter
-        create_scooter(server_urls[0], unique_scooter_id)
-        time.sleep(1)
-
-        # Do operations while other nodes might be recovering
-        operations_completed = 0
-        for i in range(20):
-            try:
-                res = reserve_scooter(server_urls[0], unique_scooter_id, f"active-{i}")
-                if res.status_code == 200:
-                    rel = release_scooter(server_urls[0], unique_scooter_id, 1)
-                    if rel.status_code == 200:
-                        operations_completed += 1
-            except Exception:
-                pass
-
-        # Should have completed most operations
-        assert operations_completed >= 18, \
-            f"Only {operations_completed} operations completed (expected ~20)"
-
 
 class TestStateReconstruction:
     """
     Tests for correct state machine reconstruction after recovery.
     """
 
-    def test_state_machine_rebuilt_correctly(self, server_urls, unique_scooter_id):
-        """
-        State machine matches expected state after recovery.
-        """
-        # Build specific state
-        create_scooter(server_urls[0], unique_scooter_id)
-
-        # 5 rounds of reserve/release
-        for i in range(5):
-            reserve_scooter(server_urls[0], unique_scooter_id, f"rebuild-{i}")
-            release_scooter(server_urls[0], unique_scooter_id, 20)
-
-        # Wait for recovery
-        time.sleep(3)
-
-        # All servers should have rebuilt state correctly
-        expected_distance = 100  # 5 * 20
-        expected_available = True
-
-        for url in server_urls:
-            try:
-                response = get_scooter(url, unique_scooter_id)
-                if response.status_code == 200:
-                    scooter = response.json()
-                    assert scooter["total_distance"] == expected_distance
-                    assert scooter["is_available"] == expected_available
-            except Exception:
-                pass
-
     def test_reservation_state_preserved(self, server_urls, unique_scooter_id, unique_reservation_id):
         """
         Reservation state survives recovery.
@@ -413,49 +337,44 @@ class TestStateReconstruction:
         reserve_scooter(server_urls[0], unique_scooter_id, unique_reservation_id)
 
         # Wait for replication
-        time.sleep(3)
+        states = _wait_all_match(server_urls, unique_scooter_id,
+                                 lambda s: not s["is_available"], timeout=3)
 
         # All servers should show reserved
-        for url in server_urls:
-            try:
-                response = get_scooter(url, unique_scooter_id)
-                if response.status_code == 200:
-                    scooter = response.json()
-                    assert scooter["is_available"] == False
-                    assert scooter["current_reservation_id"] == unique_reservation_id
-            except Exception:
-                pass
+        for scooter in states.values():
+            assert scooter["is_available"] == False
+            assert scooter["current_reservation_id"] == unique_reservation_id
 
     def test_distance_totals_preserved(self, server_urls, unique_scooter_id):
         """
         Distance totals survive recovery correctly.
         """
-        create_scooter(server_urls[0], unique_scooter_id)
+        response = create_scooter(server_urls[0], unique_scooter_id)
+        assert response.status_code == 200
 
-        # Accumulate distance over many operations
+        # Accumulate distance over many operations, each its own log entry,
+        # so recovery has to replay all of them
         expected = 0
         for i in range(10):
             distance = i + 1  # 1, 2, 3, ..., 10
-            reserve_scooter(server_urls[0], unique_scooter_id, f"distance-{i}")
-            release_scooter(server_urls[0], unique_scooter_id, distance)
+            response = reserve_scooter(server_urls[0], unique_scooter_id, f"distance-{i}")
+            assert response.status_code == 200
+            response = release_scooter(server_urls[0], unique_scooter_id, distance)
+            assert response.status_code == 200
             expected += distance
 
         # Expected: 1+2+3+...+10 = 55
         assert expected == 55
 
         # Wait for replication
-        time.sleep(3)
+        states = _wait_all_match(server_urls, unique_scooter_id,
+                                 lambda s: s["total_distance"] == expected, timeout=3)
 
         # All servers should have correct total
-        for url in server_urls:
-            try:
-                response = get_scooter(url, unique_scooter_id)
-                if response.status_code == 200:
-                    actual = response.json()["total_distance"]
-                    assert actual == expected, \
-                        f"Server has wrong distance: {actual}"
-            except Exception:
-                pass
+        for scooter in states.values():
+            actual = scooter["total_distance"]
+            assert actual == expected, \
+                f"Server has wrong distance: {actual}"
 
 
 class TestRecoveryEdgeCases:
@@ -472,49 +391,53 @@ class TestRecoveryEdgeCases:
             try:
                 response = get_all_scooters(url)
                 assert response.status_code == 200
-            except Exception:
-                pass
+            except requests.exceptions.RequestException:
+                continue
 
     def test_recovery_single_entry(self, server_urls, unique_scooter_id):
         """
         Recovery with just one log entry.
         """
         create_scooter(server_urls[0], unique_scooter_id)
-        time.sleep(2)
+        states = _wait_all_match(server_urls[1:], unique_scooter_id, lambda s: True, timeout=2)
 
         # Should replicate
-        for url in server_urls[1:]:
-            try:
-                response = get_scooter(url, unique_scooter_id)
-                if response.status_code == 200:
-                    assert response.json()["id"] == unique_scooter_id
-                    return
-            except Exception:
-                pass
+        for scooter in states.values():
+            assert scooter["id"] == unique_scooter_id
+            return
 
     def test_recovery_many_scooters(self, server_urls, unique_scooter_id):
         """
         Recovery with many different scooters.
         """
-        # Create many scooters
+        # Create many scooters (one request, one log entry)
         scooter_ids = [f"{unique_scooter_id}-many-{i}" for i in range(15)]
-        for sid in scooter_ids:
-            create_scooter(server_urls[0], sid)
+        response = create_scooters_bulk(server_urls[0], scooter_ids)
+        assert response.status_code == 200
+
+        def all_replicated():
+            for url in server_urls[1:]:
+                try:
+                    if len(get_scooters_batch(url, scooter_ids, timeout=1.0)) < len(scooter_ids):
+                        return False
+                except requests.exceptions.RequestException:
+                    return False
+            return True
 
         # Wait for replication
-        time.sleep(5)
+        wait_until(all_replicated, timeout=5)
 
         # Check one other server
         for url in server_urls[1:]:
             try:
                 response = get_all_scooters(url)
                 if response.status_code == 200:
-                    all_ids = [s["id"] for s in response.json()]
+                    all_ids = {s["id"] for s in parse_json(response)}
                     found = sum(1 for sid in scooter_ids if sid in all_ids)
                     assert found >= 10, f"Only {found}/15 scooters recovered"
                     return
-            except Exception:
-                pass
+            except requests.exceptions.RequestException:
+                continue
 
     def test_recovery_with_all_command_types(self, server_urls, unique_scooter_id, unique_reservation_id):
         """
@@ -528,18 +451,13 @@ class TestRecoveryEdgeCases:
         release_scooter(server_urls[0], unique_scooter_id, 50)
 
         # Wait for replication
-        time.sleep(3)
+        states = _wait_all_match(server_urls[1:], unique_scooter_id,
+                                 lambda s: s["total_distance"] == 50, timeout=3)
 
         # Should have processed all command types
-        for url in server_urls[1:]:
-            try:
-                response = get_scooter(url, unique_scooter_id)
-                if response.status_code == 200:
-                    scooter = response.json()
-                    # Reflects CREATE + RESERVE + RELEASE
-                    assert scooter["id"] == unique_scooter_id
-                    assert scooter["is_available"] == True
-                    assert scooter["total_distance"] == 50
-                    return
-            except Exception:
-                pass
+        for scooter in states.values():
+            # Reflects CREATE + RESERVE + RELEASE
+            assert scooter["id"] == unique_scooter_id
+            assert scooter["is_available"] == True
+            assert scooter["total_distance"] == 50
+            return
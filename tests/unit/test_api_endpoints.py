@@ -11,12 +11,7 @@ Run with: pytest tests/unit/test_api_endpoints.py -v
 """
 
 import pytest
-import requests
-import sys
-import os
 
-# Add parent directory to path so we can import from conftest
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from conftest import (
     create_scooter, get_scooter, get_all_scooters,
     reserve_scooter, release_scooter, take_snapshot
@@ -57,17 +52,14 @@ class TestScooterCRUD:
         assert response2.status_code in [400, 409], \
             f"Expected 400/409 for duplicate, got {response2.status_code}"
 
-    def test_get_scooter_success(self, api_url, unique_scooter_id):
+    def test_get_scooter_success(self, api_url, prepared_scooter):
         """GET /scooters/:id returns the scooter."""
-        # Create scooter first
-        create_scooter(api_url, unique_scooter_id)
-
         # Now get it
-        response = get_scooter(api_url, unique_scooter_id)
+        response = get_scooter(api_url, prepared_scooter)
 
         assert response.status_code == 200
         scooter = response.json()
-        assert scooter["id"] == unique_scooter_id
+        assert scooter["id"] == prepared_scooter
         assert "is_available" in scooter
         assert "total_distance" in scooter
 
@@ -102,9 +94,9 @@ class TestScooterCRUD:
         assert isinstance(scooters, list)
 
         # All our scooters should be in the list
-        returned_ids = [s["id"] for s in scooters]
-        for scooter_id in scooter_ids:
-            assert scooter_id in returned_ids, f"Scooter {scooter_id} not in response"
+        returned_ids = {s["id"] for s in scooters}
+        missing = set(scooter_ids) - returned_ids
+        assert not missing, f"Scooters not in response: {sorted(missing)}"
 
 
 # ============================================================================
@@ -114,18 +106,15 @@ class TestScooterCRUD:
 class TestReservations:
     """Tests for scooter reservation operations."""
 
-    def test_reserve_scooter_success(self, api_url, unique_scooter_id, unique_reservation_id):
+    def test_reserve_scooter_success(self, api_url, prepared_scooter, unique_reservation_id):
         """POST /scooters/:id/reservations reserves an available scooter."""
-        # Create scooter first
-        create_scooter(api_url, unique_scooter_id)
-
         # Reserve it
-        response = reserve_scooter(api_url, unique_scooter_id, unique_reservation_id)
+        response = reserve_scooter(api_url, prepared_scooter, unique_reservation_id)
 
         assert response.status_code == 200, f"Expected 200, got {response.status_code}"
 
         # Verify scooter is now reserved
-        get_response = get_scooter(api_url, unique_scooter_id)
+        get_response = get_scooter(api_url, prepared_scooter)
         scooter = get_response.json()
         assert scooter["is_available"] == False
 
@@ -136,27 +125,25 @@ class TestReservations:
         # Should fail with 404
         assert response.status_code == 404
 
-    def test_reserve_already_reserved(self, api_url, unique_scooter_id, unique_reservation_id):
+    def test_reserve_already_reserved(self, api_url, prepared_scooter, unique_reservation_id):
         """Double reservation fails."""
-        # Create and reserve scooter
-        create_scooter(api_url, unique_scooter_id)
-        reserve_scooter(api_url, unique_scooter_id, unique_reservation_id)
+        # Reserve scooter
+        reserve_scooter(api_url, prepared_scooter, unique_reservation_id)
 
         # Try to reserve again
-        response = reserve_scooter(api_url, unique_scooter_id, "another-reservation")
+        response = reserve_scooter(api_url, prepared_scooter, "another-reservation")
 
         # Should fail - scooter is already reserved
         assert response.status_code in [400, 409], \
             f"Expected 400/409 for double reservation, got {response.status_code}"
 
-    def test_reserve_with_reservation_id(self, api_url, unique_scooter_id, unique_reservation_id):
+    def test_reserve_with_reservation_id(self, api_url, prepared_scooter, unique_reservation_id):
         """Reservation ID is stored correctly."""
-        # Create and reserve scooter
-        create_scooter(api_url, unique_scooter_id)
-        reserve_scooter(api_url, unique_scooter_id, unique_reservation_id)
+        # Reserve scooter
+        reserve_scooter(api_url, prepared_scooter, unique_reservation_id)
 
         # Get scooter and check reservation ID
-        get_response = get_scooter(api_url, unique_scooter_id)
+        get_response = get_scooter(api_url, prepared_scooter)
         scooter = get_response.json()
 
         assert scooter["current_reservation_id"] == unique_reservation_id
@@ -169,32 +156,28 @@ class TestReservations:
 class TestReleases:
     """Tests for scooter release operations."""
 
-    def test_release_scooter_success(self, api_url, unique_scooter_id, unique_reservation_id):
+    def test_release_scooter_success(self, api_url, prepared_scooter, unique_reservation_id):
         """POST /scooters/:id/releases releases a reserved scooter."""
-        # Create, reserve, then release
-        create_scooter(api_url, unique_scooter_id)
-        reserve_scooter(api_url, unique_scooter_id, unique_reservation_id)
+        # Reserve, then release
+        reserve_scooter(api_url, prepared_scooter, unique_reservation_id)
 
-        response = release_scooter(api_url, unique_scooter_id, 100)
+        response = release_scooter(api_url, prepared_scooter, 100)
 
         assert response.status_code == 200
 
         # Verify scooter is now available
-        get_response = get_scooter(api_url, unique_scooter_id)
+        get_response = get_scooter(api_url, prepared_scooter)
         scooter = get_response.json()
         assert scooter["is_available"] == True
 
-    def test_release_adds_distance(self, api_url, unique_scooter_id, unique_reservation_id):
+    def test_release_adds_distance(self, api_url, prepared_scooter, unique_reservation_id):
         """Distance is accumulated after release."""
-        # Create scooter
-        create_scooter(api_url, unique_scooter_id)
-
         # Reserve and release with distance
-        reserve_scooter(api_url, unique_scooter_id, unique_reservation_id)
-        release_scooter(api_url, unique_scooter_id, 150)
+        reserve_scooter(api_url, prepared_scooter, unique_reservation_id)
+        release_scooter(api_url, prepared_scooter, 150)
 
         # Check distance
-        get_response = get_scooter(api_url, unique_scooter_id)
+        get_response = get_scooter(api_url, prepared_scooter)
         scooter = get_response.json()
         assert scooter["total_distance"] == 150
 
@@ -204,13 +187,10 @@ class TestReleases:
 
         assert response.status_code == 404
 
-    def test_release_available_scooter(self, api_url, unique_scooter_id):
+    def test_release_available_scooter(self, api_url, prepared_scooter):
         """Release an already-available scooter fails."""
-        # Create scooter (it starts available)
-        create_scooter(api_url, unique_scooter_id)
-
-        # Try to release without reserving
-        response = release_scooter(api_url, unique_scooter_id, 100)
+        # Try to release without reserving (it starts available)
+        response = release_scooter(api_url, prepared_scooter, 100)
 
         # Should fail - scooter is not reserved
         assert response.status_code in [400, 409], \
@@ -246,27 +226,25 @@ class TestEdgeCases:
 
         assert response.status_code in [200, 201]
 
-    def test_zero_distance_release(self, api_url, unique_scooter_id, unique_reservation_id):
+    def test_zero_distance_release(self, api_url, prepared_scooter, unique_reservation_id):
         """Release with zero distance works."""
-        create_scooter(api_url, unique_scooter_id)
-        reserve_scooter(api_url, unique_scooter_id, unique_reservation_id)
+        reserve_scooter(api_url, prepared_scooter, unique_reservation_id)
 
-        response = release_scooter(api_url, unique_scooter_id, 0)
+        response = release_scooter(api_url, prepared_scooter, 0)
 
         assert response.status_code == 200
 
         # Distance should still be 0
-        get_response = get_scooter(api_url, unique_scooter_id)
+        get_response = get_scooter(api_url, prepared_scooter)
         scooter = get_response.json()
         assert scooter["total_distance"] == 0
 
-    def test_empty_reservation_id(self, api_url, unique_scooter_id):
+    def test_empty_reservation_id(self, api_url, prepared_scooter, http_session):
         """Empty reservation ID might be rejected."""
-        create_scooter(api_url, unique_scooter_id)
 
         # Try with empty reservation ID
-        response = requests.post(
-            f"{api_url}/scooters/{unique_scooter_id}/reservations",
+        response = http_session.post(
+            f"{api_url}/scooters/{prepared_scooter}/reservations",
             json={"reservation_id": ""},
             timeout=10
         )